@@ -6,6 +6,8 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from season_metrics import season_from_game_id  # same folder; shared GAME_ID -> season rule
+
 
 def parse_args():
     p = argparse.ArgumentParser(
@@ -23,60 +25,49 @@ def parse_args():
     p.add_argument(
         "--pbp",
         default=None,
-        help="Path to wnba_data_clean.csv (only needed if --input lacks a 'season' column; used to map GAME_ID -> _year).",
+        help="Path to wnba_data_clean.csv (optional; maps GAME_ID -> _year when --input lacks a 'season' column, "
+             "otherwise the season is read from the GAME_ID digits).",
     )
     return p.parse_args()
 
 
-def load_aggregated(df: pd.DataFrame) -> pd.DataFrame:
-    """If the file is already aggregated with Season & Average Game Duration (min), normalize columns."""
+def load_aggregated(df: pd.DataFrame) -> pd.Series:
+    """If the file is already aggregated with Season & Average Game Duration (min), return it as a Series."""
     if {"Season", "Average Game Duration (min)"} <= set(df.columns):
-        out = df[["Season", "Average Game Duration (min)"]].copy()
-        out = out.dropna(subset=["Season", "Average Game Duration (min)"])
-        out["Season"] = out["Season"].astype(int)
-        out = out.sort_values("Season")
-        out.rename(columns={"Average Game Duration (min)": "avg_min"}, inplace=True)
-        return out
+        out = df.dropna(subset=["Season", "Average Game Duration (min)"])
+        return (
+            out.set_index(out["Season"].astype(int))["Average Game Duration (min)"]
+            .sort_index()
+            .rename_axis("Season")
+        )
     return None
 
 
-def load_per_game_with_season(df: pd.DataFrame) -> pd.DataFrame:
+def load_per_game_with_season(df: pd.DataFrame) -> pd.Series:
     """If the file has per-game durations and a 'season' column, aggregate."""
     if {"season", "duration_min"} <= set(df.columns):
-        tmp = df.dropna(subset=["season", "duration_min"]).copy()
-        tmp["season"] = tmp["season"].astype(int)
-        return (
-            tmp.groupby("season", as_index=False)["duration_min"]
-            .mean()
-            .rename(columns={"season": "Season", "duration_min": "avg_min"})
-            .sort_values("Season")
-        )
+        tmp = df.dropna(subset=["season", "duration_min"])
+        return tmp.groupby(tmp["season"].astype(int).rename("Season"), sort=True)["duration_min"].mean()
     return None
 
 
-def load_per_game_needs_merge(df: pd.DataFrame, pbp_path: str) -> pd.DataFrame:
-    """If the file has per-game durations + GAME_ID (but no 'season'), merge with PBP to get season."""
+def load_per_game_needs_merge(df: pd.DataFrame, pbp_path: str) -> pd.Series:
+    """If the file has per-game durations + GAME_ID (but no 'season'), get season from PBP or the GAME_ID."""
     if {"GAME_ID", "duration_min"} <= set(df.columns):
-        if not pbp_path:
-            raise SystemExit(
-                "Error: input has no 'season' column; please provide --pbp pointing to wnba_data_clean.csv"
+        if pbp_path:
+            pbp = pd.read_csv(pbp_path, usecols=["GAME_ID", "_year"]).drop_duplicates("GAME_ID")
+            merged = (
+                df.merge(pbp, on="GAME_ID", how="left")
+                  .rename(columns={"_year": "season"})
             )
-        pbp = pd.read_csv(pbp_path, usecols=["GAME_ID", "_year"]).drop_duplicates("GAME_ID")
-        merged = (
-            df.merge(pbp, on="GAME_ID", how="left")
-              .rename(columns={"_year": "season"})
-        )
+            merged["season"] = merged["season"].fillna(season_from_game_id(merged["GAME_ID"]))
+        else:
+            merged = df.assign(season=season_from_game_id(df["GAME_ID"]))
         missing = int(merged["season"].isna().sum())
         if missing:
             print(f"⚠️  Missing season for {missing} games — dropping those rows")
             merged = merged.dropna(subset=["season"])
-        merged["season"] = merged["season"].astype(int)
-        return (
-            merged.groupby("season", as_index=False)["duration_min"]
-            .mean()
-            .rename(columns={"season": "Season", "duration_min": "avg_min"})
-            .sort_values("Season")
-        )
+        return merged.groupby(merged["season"].astype(int).rename("Season"), sort=True)["duration_min"].mean()
     return None
 
 
@@ -92,11 +83,11 @@ def main():
     df = pd.read_csv(in_path)
 
     # Try three schemas in order:
-    season_avg = (
-        load_aggregated(df)
-        or load_per_game_with_season(df)
-        or load_per_game_needs_merge(df, args.pbp)
-    )
+    season_avg = load_aggregated(df)
+    if season_avg is None:
+        season_avg = load_per_game_with_season(df)
+    if season_avg is None:
+        season_avg = load_per_game_needs_merge(df, args.pbp)
 
     if season_avg is None:
         cols = list(df.columns)
@@ -109,11 +100,8 @@ def main():
         )
 
     # Plot
-    seasons = season_avg["Season"].astype(int).tolist()
-    values = season_avg["avg_min"].tolist()
-
     fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(seasons, values, marker="o")
+    ax.plot(season_avg.index, season_avg.to_numpy(), marker="o")
     ax.set_title("Average Game Duration by Season (minutes)")
     ax.set_xlabel("Season")
     ax.set_ylabel("Minutes")
@@ -121,7 +109,7 @@ def main():
 
     # Label each point with the rounded value
     rd = args.round_digits
-    for x, y in zip(seasons, values):
+    for x, y in season_avg.items():
         ax.annotate(
             f"{round(y, rd)}",
             (x, y),
@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from scipy.stats import skew
+from scipy.stats import mode, skew
 
 # File paths
 input_file = "/Users/abhinavapendyala/Downloads/wnba_data_raw/wnba_game_times.csv"
@@ -15,16 +16,15 @@ df_clean = df[(df["duration_min"] >= 90) & (df["duration_min"] <= 180)].dropna(s
 df_clean.to_csv(cleaned_summary_file, index=False)
 print(f"✅ Cleaned per-game summary saved to: {cleaned_summary_file}")
 
-# Calculate stats
-mean_duration = df_clean["duration_min"].mean()
-median_duration = df_clean["duration_min"].median()
-mode_duration = df_clean["duration_min"].mode()[0]
-q1 = df_clean["duration_min"].quantile(0.25)
-q3 = df_clean["duration_min"].quantile(0.75)
-min_duration = df_clean["duration_min"].min()
-max_duration = df_clean["duration_min"].max()
-std_dev = df_clean["duration_min"].std()
-skewness_val = skew(df_clean["duration_min"])
+# Calculate stats (one array, one sort for all quantiles)
+arr = df_clean["duration_min"].to_numpy(dtype=float)
+mean_duration = arr.mean()
+q1, median_duration, q3 = np.quantile(arr, [0.25, 0.5, 0.75])
+mode_duration = mode(arr, keepdims=False).mode
+min_duration = arr.min()
+max_duration = arr.max()
+std_dev = arr.std(ddof=1)
+skewness_val = skew(arr)
 
 # Print results
 print(f"Mean: {mean_duration:.2f} minutes")
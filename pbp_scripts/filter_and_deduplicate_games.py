@@ -7,13 +7,14 @@ input_file = "/Users/abhinavapendyala/Downloads/wnba/wnba_game_durations_only_al
 df = pd.read_csv(input_file)
 
 # ✅ Extract season from the source_file column (e.g., wnba_2014_Team_pbp_duration_rows.csv → 2014)
-df["season"] = df["source_file"].str.extract(r"wnba_(\d{4})_")[0].astype(int)
+# Fixed "wnba_YYYY_" prefix, so slice the year rather than run a regex per row
+df["season"] = df["source_file"].str.slice(5, 9).astype("int16")
 
 # ✅ Filter out games with durations that are unrealistic (<90 or >180 minutes)
-filtered_df = df[(df["game_duration_minutes"] >= 90) & (df["game_duration_minutes"] <= 180)]
+in_range = df["game_duration_minutes"].between(90, 180)
 
 # ✅ Drop duplicates — keep only one entry per GAME_ID
-deduped_df = filtered_df.drop_duplicates(subset="GAME_ID")
+deduped_df = df[in_range].drop_duplicates(subset="GAME_ID")
 
 # ✅ Save the cleaned and deduplicated data
 output_file = "/Users/abhinavapendyala/Downloads/wnba/wnba_cleaned_durations_1997_2024.csv"
@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 import re
 import unittest
@@ -12,6 +13,26 @@ in order.
 NOTE: This function is not intended to be a CLI script, and will likely be moved elsewhere in the future.
       It is written here initially for reference and testing by the team.
 """
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def parse_12_hour_minutes(pbp_game_df: pd.DataFrame) -> np.ndarray:
+    """Parse every WCTIMESTRING of the game in one call; returns minutes since midnight, NaN where the time is missing."""
+    # Times repeat a lot within a game: parse each distinct string once, then map back by code
+    codes, uniques = pd.factorize(pbp_game_df['WCTIMESTRING'], use_na_sentinel=False)
+    t = pd.to_datetime(uniques, format='%I:%M %p')
+    minutes = (t.hour * 60 + t.minute).to_numpy(dtype=np.float64)
+    minutes[t.isna()] = np.nan
+    return minutes[codes]
+
+
+def rollover_diff_minutes(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Elementwise end - start, treating a negative difference as a midnight rollover."""
+    diff = end - start
+    return np.where(diff < 0, diff + MINUTES_PER_DAY, diff)
+
+
 def find_many_events_in_short_time_12_hour_standard(pbp_game_df: pd.DataFrame, 
                                                     minutes_threshold: int = 0, 
                                                     event_num_diff: int = 10) -> pd.DataFrame:
@@ -30,37 +51,24 @@ def find_many_events_in_short_time_12_hour_standard(pbp_game_df: pd.DataFrame,
         pd.DataFrame: DataFrame containing events in which event_num_diff events occur within the specified minutes threshold.
     """
 
-    many_events = []
-    for i in range(len(pbp_game_df) - event_num_diff + 1):
-        start_event = pbp_game_df.iloc[i]
-        end_event = pbp_game_df.iloc[i + event_num_diff - 1]
-        start_datetime = pd.to_datetime(start_event['WCTIMESTRING'], format='%I:%M %p')
-        end_datetime = pd.to_datetime(end_event['WCTIMESTRING'], format='%I:%M %p')
-
-        # Handle midnight rollover
-        if end_datetime < start_datetime:
-            end_datetime += pd.Timedelta(days=1)
-
-        # Calculate the difference in minutes
-        min_diff = (end_datetime - start_datetime)
-
-        # The window of times is too short if the difference is less than or equal to the threshold
-        if min_diff < pd.Timedelta(minutes=0):
-            raise ValueError("The time difference cannot be negative. Please check the input data.")
-
-        # If the difference is less than or equal to the threshold, we consider it a short time period
-        # and we add the triggering event to the list.
-        if min_diff <= pd.Timedelta(minutes=minutes_threshold):
-            many_event = {
-                'GAME_ID': start_event['GAME_ID'],
-                'EVENTNUM_START': start_event['EVENTNUM'],
-                'EVENTNUM_END': end_event['EVENTNUM'],
-                'EVENT_COUNT': event_num_diff,
-                'START_TIME': start_event['WCTIMESTRING'],
-                'END_TIME': end_event['WCTIMESTRING'],
-            }
-            many_events.append(many_event)
-    return pd.DataFrame(many_events)
+    # Sliding window of event_num_diff events: first vs last time of every window at once
+    k = event_num_diff - 1
+    t = parse_12_hour_minutes(pbp_game_df)
+    n = max(len(t) - k, 0)
+    diff = rollover_diff_minutes(t[:n], t[k:k + n])
+
+    # If the difference is less than or equal to the threshold, we consider it a short time period.
+    # Windows that start or end on a missing time are skipped.
+    idx = np.flatnonzero(~np.isnan(diff) & (diff <= minutes_threshold))
+
+    return pd.DataFrame({
+        'GAME_ID': pbp_game_df['GAME_ID'].to_numpy()[idx],
+        'EVENTNUM_START': pbp_game_df['EVENTNUM'].to_numpy()[idx],
+        'EVENTNUM_END': pbp_game_df['EVENTNUM'].to_numpy()[idx + k],
+        'EVENT_COUNT': event_num_diff,
+        'START_TIME': pbp_game_df['WCTIMESTRING'].to_numpy()[idx],
+        'END_TIME': pbp_game_df['WCTIMESTRING'].to_numpy()[idx + k],
+    })
 
 
 def find_long_events_12_hour_standard(pbp_game_df: pd.DataFrame, minutes_threshold: int = 20, event_num_diff: int = 1) -> pd.DataFrame:
@@ -82,326 +90,272 @@ def find_long_events_12_hour_standard(pbp_game_df: pd.DataFrame, minutes_thresho
         pd.DataFrame: DataFrame containing the long events found.
     """
 
-    # Use two pointers to find ranges that exceed the time threshold
-    long_events = []
-    for i in range(len(pbp_game_df) - event_num_diff):
-        # Get the time strings
-        start_event = pbp_game_df.iloc[i]
-        end_event = pbp_game_df.iloc[i + event_num_diff]
-        start_datetime = pd.to_datetime(start_event['WCTIMESTRING'], format='%I:%M %p')
-        end_datetime = pd.to_datetime(end_event['WCTIMESTRING'], format='%I:%M %p')
-
-        # Handle midnight rollover
-        if end_datetime < start_datetime:
-            end_datetime += pd.Timedelta(days=1)
-
-        min_diff = (end_datetime - start_datetime)
-
-        # Calculate the difference in minutes
-        min_diff = (end_datetime - start_datetime)
-        if min_diff > pd.Timedelta(minutes=minutes_threshold):
-            # Setup tuple format
-            long_event = {
-                'GAME_ID': start_event['GAME_ID'],
-                'EVENTNUM': start_event['EVENTNUM'],
-                'START_TIME': start_event['WCTIMESTRING'],
-                'END_TIME': end_event['WCTIMESTRING'],
-                'MIN_DIFF': min_diff,
-            }
-            # Append to the list of long events
-            long_events.append(long_event)
-
-    return pd.DataFrame(long_events)
+    # Compare each event with the one event_num_diff rows later, all at once
+    t = parse_12_hour_minutes(pbp_game_df)
+    n = max(len(t) - event_num_diff, 0)
+    diff = rollover_diff_minutes(t[:n], t[event_num_diff:event_num_diff + n])
+    # Pairs that start or end on a missing time are skipped
+    idx = np.flatnonzero(~np.isnan(diff) & (diff > minutes_threshold))
+
+    return pd.DataFrame({
+        'GAME_ID': pbp_game_df['GAME_ID'].to_numpy()[idx],
+        'EVENTNUM': pbp_game_df['EVENTNUM'].to_numpy()[idx],
+        'START_TIME': pbp_game_df['WCTIMESTRING'].to_numpy()[idx],
+        'END_TIME': pbp_game_df['WCTIMESTRING'].to_numpy()[idx + event_num_diff],
+        'MIN_DIFF': pd.to_timedelta(diff[idx], unit='m'),
+    })
+
+
+def make_game_df(times) -> pd.DataFrame:
+    """Single-game play-by-play frame (GAME_ID 1, EVENTNUM 1..n) for the given WCTIMESTRING values."""
+    return pd.DataFrame({
+        'GAME_ID': 1,
+        'EVENTNUM': range(1, len(times) + 1),
+        'WCTIMESTRING': list(times),
+    })
 
 
 class TestFindLongEvents(unittest.TestCase):
     """
     Tests long events with a threshold of 2 minutes.
     """
-    am_data_no_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['11:30 AM', '11:31 AM', '11:32 AM', '11:33 AM', '11:34 AM'],
-    }
-
-    am_data_with_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['11:30 AM', '11:31 AM', '11:35 AM', '11:36 AM', '11:37 AM'],
-    }
-
-    pm_data_no_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['12:30 PM', '12:31 PM', '12:32 PM', '12:33 PM', '12:34 PM'],
-    }
-
-    pm_data_with_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['12:30 PM', '12:31 PM', '12:35 PM', '12:36 PM', '12:37 PM'],
-    }
-
-    turnover_noon_data_no_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['11:59 AM', '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM'],
-    }
-
-    turnover_noon_data_with_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['11:59 AM', '12:00 PM', '12:03 PM', '12:04 PM', '12:05 PM'],
-    }
-
-    turnover_midnight_data_no_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['11:59 PM', '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM'],
-    }
-
-    turnover_midnight_data_with_jump = {
-        'GAME_ID': [1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5],
-        'WCTIMESTRING': ['11:59 PM', '12:00 AM', '12:04 AM', '12:05 AM', '12:06 AM'],
-    }
+    am_data_no_jump = ('11:30 AM', '11:31 AM', '11:32 AM', '11:33 AM', '11:34 AM')
+
+    am_data_with_jump = ('11:30 AM', '11:31 AM', '11:35 AM', '11:36 AM', '11:37 AM')
+
+    pm_data_no_jump = ('12:30 PM', '12:31 PM', '12:32 PM', '12:33 PM', '12:34 PM')
+
+    pm_data_with_jump = ('12:30 PM', '12:31 PM', '12:35 PM', '12:36 PM', '12:37 PM')
+
+    turnover_noon_data_no_jump = ('11:59 AM', '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM')
+
+    turnover_noon_data_with_jump = ('11:59 AM', '12:00 PM', '12:03 PM', '12:04 PM', '12:05 PM')
+
+    turnover_midnight_data_no_jump = ('11:59 PM', '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM')
+
+    turnover_midnight_data_with_jump = ('11:59 PM', '12:00 AM', '12:04 AM', '12:05 AM', '12:06 AM')
+
+    missing_time_data_no_jump = ('7:00 PM', np.nan, '7:01 PM', '7:02 PM', '7:03 PM')
 
     def test_find_long_events_am_no_jump(self):
-        df = pd.DataFrame(self.am_data_no_jump)
+        df = make_game_df(self.am_data_no_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertTrue(result.empty, "Expected no long events in AM data without jumps.")
 
     def test_find_long_events_am_with_jump(self):
-        df = pd.DataFrame(self.am_data_with_jump)
+        df = make_game_df(self.am_data_with_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertFalse(result.empty, "Expected long events in AM data with jumps.")
 
     def test_find_long_events_pm_no_jump(self):
-        df = pd.DataFrame(self.pm_data_no_jump)
+        df = make_game_df(self.pm_data_no_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertTrue(result.empty, "Expected no long events in PM data without jumps.")
 
     def test_find_long_events_pm_with_jump(self):
-        df = pd.DataFrame(self.pm_data_with_jump)
+        df = make_game_df(self.pm_data_with_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertFalse(result.empty, "Expected long events in PM data with jumps.")
 
     def test_find_long_events_turnover_noon_no_jump(self):
-        df = pd.DataFrame(self.turnover_noon_data_no_jump)
+        df = make_game_df(self.turnover_noon_data_no_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertTrue(result.empty, "Expected no long events in turnover noon data without jumps.")
 
     def test_find_long_events_turnover_noon_with_jump(self):
-        df = pd.DataFrame(self.turnover_noon_data_with_jump)
+        df = make_game_df(self.turnover_noon_data_with_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertFalse(result.empty, "Expected long events in turnover noon data with jumps.")
 
     def test_find_long_events_turnover_midnight_no_jump(self):
-        df = pd.DataFrame(self.turnover_midnight_data_no_jump)
+        df = make_game_df(self.turnover_midnight_data_no_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertTrue(result.empty, "Expected no long events in turnover midnight data without jumps.")
 
     def test_find_long_events_turnover_midnight_with_jump(self):
-        df = pd.DataFrame(self.turnover_midnight_data_with_jump)
+        df = make_game_df(self.turnover_midnight_data_with_jump)
         result = find_long_events_12_hour_standard(df, 2)
         self.assertFalse(result.empty, "Expected long events in turnover midnight data with jumps.")
 
+    def test_find_long_events_missing_time_no_jump(self):
+        df = make_game_df(self.missing_time_data_no_jump)
+        result = find_long_events_12_hour_standard(df, 20)
+        self.assertTrue(result.empty, "Expected no long events around a missing time.")
+
 class TestFindManyEvents(unittest.TestCase):
     """
     Tests for finding many events in play-by-play data with event_num_diff of 4
     """
-    am_data_no_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:30 AM', '11:31 AM', '11:32 AM', '11:33 AM', '11:34 AM',
-                        '11:35 AM', '11:36 AM', '11:37 AM', '11:38 AM', '11:39 AM'],
-    }
-
-    am_data_some_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:30 AM', '11:30 AM', '11:30 AM', '11:30 AM', '11:33 AM',
-                        '11:35 AM', '11:36 AM', '11:37 AM', '11:38 AM', '11:39 AM'],
-    }
-
-    am_data_most_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': [ '11:30 AM', '11:30 AM', '11:30 AM', '11:30 AM', '11:30 AM',
-                        '11:35 AM', '11:36 AM', '11:37 AM', '11:38 AM', '11:39 AM'],
-    }
-
-    pm_data_no_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['12:30 PM', '12:31 PM', '12:32 PM', '12:33 PM', '12:34 PM',
-                        '12:35 PM', '12:36 PM', '12:37 PM', '12:38 PM', '12:39 PM'],
-    }
-
-    pm_data_some_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['12:30 PM', '12:30 PM', '12:30 PM', '12:30 PM', '12:34 PM',
-                        '12:35 PM', '12:36 PM', '12:37 PM', '12:38 PM', '12:39 PM'],
-    }
-
-    pm_data_most_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['12:30 PM', '12:30 PM', '12:30 PM', '12:30 PM', '12:33 PM',
-                        '12:35 PM', '12:36 PM', '12:37 PM', '12:38 PM', '12:39 PM'],
-    }
-
-    turnover_noon_data_no_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 AM', '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM', 
-                         '12:04 PM', '12:05 PM', '12:06 PM', '12:07 PM', '12:08 PM'],
-    }
-
-    turnover_noon_data_some_dupes_before = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 AM', '11:59 AM', '11:59 AM', '11:59 AM', '12:01 PM',
-                        '12:02 PM', '12:03 PM', '12:04 PM', '12:05 PM', '12:06 PM'],
-    }
-
-    turnover_noon_data_some_dupes_after = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:58 AM', '12:00 PM', '12:00 PM', '12:00 PM', '12:00 PM',
-                        '12:02 PM', '12:03 PM', '12:04 PM', '12:05 PM', '12:06 PM'],
-    }
-
-    turnover_noon_data_most_dupes_before = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 AM', '11:59 AM', '11:59 AM', '11:59 AM', '11:59 AM',
-                        '11:59 AM', '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM'],
-    }
-
-    turnover_noon_data_most_dupes_after = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 AM', '12:00 PM', '12:00 PM', '12:00 PM', '12:00 PM',
-                        '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM', '12:04 PM'],
-    }
-
-    turnover_midnight_data_no_dupes = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 PM', '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM',
-                        '12:04 AM', '12:05 AM', '12:06 AM', '12:07 AM', '12:08 AM'],
-    }
-
-    turnover_midnight_data_some_dupes_before = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 PM', '11:59 PM', '11:59 PM', '11:59 PM', '12:02 AM',
-                        '12:03 AM', '12:04 AM', '12:05 AM', '12:06 AM', '12:07 AM'],
-    }
-
-    turnover_midnight_data_some_dupes_after = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:58 PM', '12:00 AM', '12:00 AM', '12:00 AM', '12:00 AM',
-                        '12:02 AM', '12:03 AM', '12:04 AM', '12:05 AM', '12:06 AM'],
-    }
-
-    turnover_midnight_data_most_dupes_before = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 PM', '11:59 PM', '11:59 PM', '11:59 PM', '11:59 PM',
-                        '11:59 PM', '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM'],
-    }
-
-    turnover_midnight_data_most_dupes_after = {
-        'GAME_ID': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        'EVENTNUM': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-        'WCTIMESTRING': ['11:59 PM', '12:00 AM', '12:00 AM', '12:00 AM', '12:00 AM',
-                        '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM', '12:04 AM'],
-    }
+    am_data_no_dupes = (
+        '11:30 AM', '11:31 AM', '11:32 AM', '11:33 AM', '11:34 AM',
+        '11:35 AM', '11:36 AM', '11:37 AM', '11:38 AM', '11:39 AM'
+    )
+
+    am_data_some_dupes = (
+        '11:30 AM', '11:30 AM', '11:30 AM', '11:30 AM', '11:33 AM',
+        '11:35 AM', '11:36 AM', '11:37 AM', '11:38 AM', '11:39 AM'
+    )
+
+    am_data_most_dupes = (
+        '11:30 AM', '11:30 AM', '11:30 AM', '11:30 AM', '11:30 AM',
+        '11:35 AM', '11:36 AM', '11:37 AM', '11:38 AM', '11:39 AM'
+    )
+
+    pm_data_no_dupes = (
+        '12:30 PM', '12:31 PM', '12:32 PM', '12:33 PM', '12:34 PM',
+        '12:35 PM', '12:36 PM', '12:37 PM', '12:38 PM', '12:39 PM'
+    )
+
+    pm_data_some_dupes = (
+        '12:30 PM', '12:30 PM', '12:30 PM', '12:30 PM', '12:34 PM',
+        '12:35 PM', '12:36 PM', '12:37 PM', '12:38 PM', '12:39 PM'
+    )
+
+    pm_data_most_dupes = (
+        '12:30 PM', '12:30 PM', '12:30 PM', '12:30 PM', '12:33 PM',
+        '12:35 PM', '12:36 PM', '12:37 PM', '12:38 PM', '12:39 PM'
+    )
+
+    turnover_noon_data_no_dupes = (
+        '11:59 AM', '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM',
+        '12:04 PM', '12:05 PM', '12:06 PM', '12:07 PM', '12:08 PM'
+    )
+
+    turnover_noon_data_some_dupes_before = (
+        '11:59 AM', '11:59 AM', '11:59 AM', '11:59 AM', '12:01 PM',
+        '12:02 PM', '12:03 PM', '12:04 PM', '12:05 PM', '12:06 PM'
+    )
+
+    turnover_noon_data_some_dupes_after = (
+        '11:58 AM', '12:00 PM', '12:00 PM', '12:00 PM', '12:00 PM',
+        '12:02 PM', '12:03 PM', '12:04 PM', '12:05 PM', '12:06 PM'
+    )
+
+    turnover_noon_data_most_dupes_before = (
+        '11:59 AM', '11:59 AM', '11:59 AM', '11:59 AM', '11:59 AM',
+        '11:59 AM', '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM'
+    )
+
+    turnover_noon_data_most_dupes_after = (
+        '11:59 AM', '12:00 PM', '12:00 PM', '12:00 PM', '12:00 PM',
+        '12:00 PM', '12:01 PM', '12:02 PM', '12:03 PM', '12:04 PM'
+    )
+
+    turnover_midnight_data_no_dupes = (
+        '11:59 PM', '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM',
+        '12:04 AM', '12:05 AM', '12:06 AM', '12:07 AM', '12:08 AM'
+    )
+
+    turnover_midnight_data_some_dupes_before = (
+        '11:59 PM', '11:59 PM', '11:59 PM', '11:59 PM', '12:02 AM',
+        '12:03 AM', '12:04 AM', '12:05 AM', '12:06 AM', '12:07 AM'
+    )
+
+    turnover_midnight_data_some_dupes_after = (
+        '11:58 PM', '12:00 AM', '12:00 AM', '12:00 AM', '12:00 AM',
+        '12:02 AM', '12:03 AM', '12:04 AM', '12:05 AM', '12:06 AM'
+    )
+
+    turnover_midnight_data_most_dupes_before = (
+        '11:59 PM', '11:59 PM', '11:59 PM', '11:59 PM', '11:59 PM',
+        '11:59 PM', '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM'
+    )
+
+    turnover_midnight_data_most_dupes_after = (
+        '11:59 PM', '12:00 AM', '12:00 AM', '12:00 AM', '12:00 AM',
+        '12:00 AM', '12:01 AM', '12:02 AM', '12:03 AM', '12:04 AM'
+    )
+
+    missing_time_data_no_dupes = (
+        np.nan, '11:56 PM', '11:57 PM', '11:58 PM', '12:00 AM',
+        '12:01 AM', '12:03 AM', '12:04 AM', '12:06 AM', '12:08 AM'
+    )
 
     def test_find_many_events_am_no_dupes(self):
-        df = pd.DataFrame(self.am_data_no_dupes)
+        df = make_game_df(self.am_data_no_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in AM data without duplicates.")
 
     def test_find_many_events_am_some_dupes(self):
-        df = pd.DataFrame(self.am_data_some_dupes)
+        df = make_game_df(self.am_data_some_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected many events in AM data with some duplicates.")
 
     def test_find_many_events_am_most_dupes(self):
-        df = pd.DataFrame(self.am_data_most_dupes)
+        df = make_game_df(self.am_data_most_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertFalse(result.empty, "Expected many events in AM data with most duplicates.") 
 
     def test_find_many_events_pm_no_dupes(self):
-        df = pd.DataFrame(self.pm_data_no_dupes)
+        df = make_game_df(self.pm_data_no_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in PM data without duplicates.")
 
     def test_find_many_events_pm_some_dupes(self):
-        df = pd.DataFrame(self.pm_data_some_dupes)
+        df = make_game_df(self.pm_data_some_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected many events in PM data with some duplicates.")
 
     def test_find_many_events_pm_most_dupes(self):
-        df = pd.DataFrame(self.pm_data_most_dupes)
+        df = make_game_df(self.pm_data_most_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected many events in PM data with most duplicates.")
 
     def test_find_many_events_turnover_noon_no_dupes(self):
-        df = pd.DataFrame(self.turnover_noon_data_no_dupes)
+        df = make_game_df(self.turnover_noon_data_no_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in turnover data without duplicates.")
 
     def test_find_many_events_turnover_noon_some_dupes_before(self):
-        df = pd.DataFrame(self.turnover_noon_data_some_dupes_before)
+        df = make_game_df(self.turnover_noon_data_some_dupes_before)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in turnover data with some duplicates before.")
     
     def test_find_many_events_turnover_noon_some_dupes_after(self):
-        df = pd.DataFrame(self.turnover_noon_data_some_dupes_after)
+        df = make_game_df(self.turnover_noon_data_some_dupes_after)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in turnover data with some duplicates after.")
 
     def test_find_many_events_turnover_noon_most_dupes_before(self):
-        df = pd.DataFrame(self.turnover_noon_data_most_dupes_before)
+        df = make_game_df(self.turnover_noon_data_most_dupes_before)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertFalse(result.empty, "Expected no many events in turnover data with most duplicates before.")
 
     def test_find_many_events_turnover_noon_most_dupes_after(self):
-        df = pd.DataFrame(self.turnover_noon_data_most_dupes_after)
+        df = make_game_df(self.turnover_noon_data_most_dupes_after)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertFalse(result.empty, "Expected no many events in turnover data with most duplicates after.")
     
     def test_find_many_events_turnover_midnight_no_dupes(self):
-        df = pd.DataFrame(self.turnover_midnight_data_no_dupes)
+        df = make_game_df(self.turnover_midnight_data_no_dupes)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in turnover data with no duplicates.")
 
     def test_find_many_events_turnover_midnight_some_dupes_before(self):
-        df = pd.DataFrame(self.turnover_midnight_data_some_dupes_before)
+        df = make_game_df(self.turnover_midnight_data_some_dupes_before)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in turnover data with some duplicates before.")
 
     def test_find_many_events_turnover_midnight_some_dupes_after(self):
-        df = pd.DataFrame(self.turnover_midnight_data_some_dupes_after)
+        df = make_game_df(self.turnover_midnight_data_some_dupes_after)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertTrue(result.empty, "Expected no many events in turnover data with some duplicates after.")
 
     def test_find_many_events_turnover_midnight_most_dupes_before(self):
-        df = pd.DataFrame(self.turnover_midnight_data_most_dupes_before)
+        df = make_game_df(self.turnover_midnight_data_most_dupes_before)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertFalse(result.empty, "Expected many events in turnover data with most duplicates before.")
 
     def test_find_many_events_turnover_midnight_most_dupes_after(self):
-        df = pd.DataFrame(self.turnover_midnight_data_most_dupes_after)
+        df = make_game_df(self.turnover_midnight_data_most_dupes_after)
         result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
         self.assertFalse(result.empty, "Expected many events in turnover data with most duplicates after.")
 
+    def test_find_many_events_missing_time_no_dupes(self):
+        df = make_game_df(self.missing_time_data_no_dupes)
+        result = find_many_events_in_short_time_12_hour_standard(df, 1, 5)
+        self.assertTrue(result.empty, "Expected no many events in windows touching a missing time.")
+
 if __name__ == "__main__":
     # Call this script with 
     # `python -m unittest pbp_scripts.find_event_densities` 
@@ -7,52 +7,85 @@ Example:
 """
 
 import argparse
+import codecs
 import csv
+import gzip
 import os
+import sys
+import tempfile
+import unittest
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
-from typing import Optional, Tuple, List
+from itertools import repeat
+from typing import Dict, Iterator, Optional, Tuple, List
+from unittest import mock
 
 import pandas as pd
 
 
 def preview(path: str, n: int = 400) -> str:
     try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8", errors="ignore") as f:
             return f.read(n)
     except Exception as e:
         return f"<preview failed: {e!r}>"
 
 
-def robust_read_csv(path: str, debug: bool = False) -> Optional[pd.DataFrame]:
+def sniff_format(path: str, sample_bytes: int = 64 * 1024) -> Tuple[str, str]:
+    """Guess (encoding, separator) from the head of the file."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        raw = f.read(sample_bytes)
+
+    if raw.startswith(codecs.BOM_UTF8):
+        enc = "utf-8-sig"
+    else:
+        try:
+            # Incremental decode so a multi-byte char cut off at the sample edge is not an error
+            codecs.getincrementaldecoder("utf-8")().decode(raw, final=False)
+            enc = "utf-8"
+        except UnicodeDecodeError:
+            enc = "latin-1"
+
+    try:
+        sep = csv.Sniffer().sniff(raw.decode(enc, errors="ignore"), delimiters=",\t|").delimiter
+    except csv.Error:
+        sep = ","
+    return enc, sep
+
+
+def robust_read_csv(path: str, debug: bool = False, nrows: Optional[int] = None,
+                    fmt: Optional[Tuple[str, str]] = None) -> Optional[pd.DataFrame]:
     """
-    Try several encodings/separators/engines. IMPORTANT:
+    Sniff encoding/separator once, then try a short list of engines. IMPORTANT:
     Do not pass low_memory when using engine='python' (pandas limitation).
+    nrows limits the rows read (nrows=0 reads just the header).
+    fmt is an (encoding, separator) pair from an earlier sniff_format call; the file is not sniffed again.
     """
-    # (sep, engine, quoting) — quoting=None means "leave default"
-    attempts: List[Tuple[Optional[str], str, Optional[int]]] = [
-        (None, "c", None),         # let pandas sniff with C engine
-        (",", "c", None),
-        ("\t", "c", None),
-        ("|", "c", None),
-        (",", "python", None),
-        ("\t", "python", None),
-        ("|", "python", None),
+    enc, sep = fmt if fmt is not None else sniff_format(path)
+    if debug:
+        print(f"   sniffed {os.path.basename(path)}: encoding={enc} sep={sep!r}")
+
+    # (engine, quoting) — quoting=None means "leave default"
+    attempts: List[Tuple[str, Optional[int]]] = [
+        ("c", None),
         # Try "no-quote" mode for nasty quote chars in text
-        (",", "python", csv.QUOTE_NONE),
+        ("python", csv.QUOTE_NONE),
     ]
-
-    encodings = ["utf-8", "utf-8-sig", "latin-1"]
+    # latin-1 decodes any byte, so it is the fallback if the sample looked like UTF-8 but the file is not
+    encodings = [enc] if enc == "latin-1" else [enc, "latin-1"]
 
     for enc in encodings:
-        for sep, engine, quoting in attempts:
+        for engine, quoting in attempts:
             try:
                 # Base kwargs (shared)
                 kwargs = dict(
+                    sep=sep,
                     encoding=enc,
                     on_bad_lines="warn",  # skip/warn malformed rows
                 )
-                if sep is not None:
-                    kwargs["sep"] = sep
                 # Only set low_memory for C engine
                 if engine == "c":
                     kwargs["engine"] = "c"
@@ -60,6 +93,8 @@ def robust_read_csv(path: str, debug: bool = False) -> Optional[pd.DataFrame]:
                 else:
                     kwargs["engine"] = "python"
                     # DO NOT set low_memory for python engine
+                if nrows is not None:
+                    kwargs["nrows"] = nrows
                 if quoting is not None:
                     kwargs["quoting"] = quoting
                     # For QUOTE_NONE, python engine needs an escapechar
@@ -73,9 +108,7 @@ def robust_read_csv(path: str, debug: bool = False) -> Optional[pd.DataFrame]:
                 return df
             except Exception as e:
                 if debug:
-                    label = f"auto-sep" if sep is None else (
-                        "comma" if sep == "," else "tab" if sep == "\t" else "pipe"
-                    )
+                    label = f"{engine}-{enc}"
                     if quoting == csv.QUOTE_NONE:
                         label += "-noquote"
                     print(f"   parse fail via {label}: {e}")
@@ -83,6 +116,90 @@ def robust_read_csv(path: str, debug: bool = False) -> Optional[pd.DataFrame]:
     return None
 
 
+def mangle_columns(columns: List) -> List[str]:
+    """
+    Name columns the way pandas' C parser does: empty names become "Unnamed: N" (N = position) and
+    repeats get ".1", ".2", … suffixes, so header and body passes always agree on the labels.
+    """
+    names, unnamed = [], []
+    for i, col in enumerate(columns):
+        if col is None or (isinstance(col, float) and pd.isna(col)) or str(col) == "":
+            col = f"Unnamed: {i}"
+            unnamed.append(i)
+        names.append(str(col))
+
+    # Same walk as the C parser: given names before unnamed ones, and a suffix already
+    # present in the header is skipped
+    counts: Dict[str, int] = {}
+    for i in [i for i in range(len(names)) if i not in unnamed] + unnamed:
+        col = old_col = names[i]
+        cur_count = counts.get(col, 0)
+        while cur_count > 0:
+            counts[old_col] = cur_count + 1
+            col = f"{old_col}.{cur_count}"
+            cur_count = cur_count + 1 if col in names else counts.get(col, 0)
+        names[i] = col
+        counts[col] = cur_count + 1
+    return names
+
+
+def provenance_columns(path: str, root: str) -> Dict[str, str]:
+    """Lightweight provenance columns (year/team from filename if possible, plus the source path)."""
+    base = os.path.basename(path)
+    extra = {}
+    try:
+        # e.g., wnba_2021_Aces_pbp.csv or wnba_2021_Aces_pbp.csv.gz
+        parts = base.split("_")
+        if len(parts) >= 4 and parts[0] == "wnba":
+            extra["_year"] = parts[1]
+            extra["_team_from_path"] = parts[2]
+    except Exception:
+        pass
+    extra["_source_file"] = os.path.relpath(path, root)
+    return extra
+
+
+def read_columns(path: str, root: str) -> Tuple[Optional[List[str]], Tuple[str, str]]:
+    """
+    Column names read_one will produce for this file (header only), plus the sniffed
+    (encoding, separator) so the body read can reuse it; runs in a worker process.
+    """
+    fmt = sniff_format(path)
+    header = robust_read_csv(path, nrows=0, fmt=fmt)
+    if header is None:
+        return None, fmt
+    return mangle_columns(list(header.columns)) + list(provenance_columns(path, root)), fmt
+
+
+def read_one(path: str, root: str, debug: bool = False,
+             fmt: Optional[Tuple[str, str]] = None) -> Optional[pd.DataFrame]:
+    """robust_read_csv plus lightweight provenance columns; runs in a worker process."""
+    df = robust_read_csv(path, debug=debug, fmt=fmt)
+    if df is None:
+        return None
+    df.columns = mangle_columns(list(df.columns))
+    for col, value in provenance_columns(path, root).items():
+        df[col] = value
+    return df
+
+
+def read_in_order(ex: ProcessPoolExecutor, files: List[str], fmts: List[Tuple[str, str]], root: str,
+                  debug: bool, window: int) -> Iterator[Tuple[str, Optional[pd.DataFrame]]]:
+    """
+    Yield (path, frame) in file order, keeping at most `window` reads submitted ahead of the consumer
+    so parsed frames never pile up in memory faster than they are written.
+    """
+    pending = deque()
+    for path, fmt in zip(files, fmts):
+        pending.append((path, ex.submit(read_one, path, root, debug, fmt)))
+        if len(pending) >= window:
+            path_done, future = pending.popleft()
+            yield path_done, future.result()
+    while pending:
+        path_done, future = pending.popleft()
+        yield path_done, future.result()
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--root", required=True, help="Root folder containing year subfolders")
@@ -90,53 +207,77 @@ def main():
     ap.add_argument("--debug", action="store_true", help="Print debug previews and parse attempts")
     args = ap.parse_args()
 
-    # Find all *_pbp.csv under root
-    pattern = os.path.join(args.root, "**", "*_pbp.csv")
-    files = sorted(glob(pattern, recursive=True))
+    # Find all *_pbp.csv (and gzipped *_pbp.csv.gz) under root
+    files = sorted(
+        path
+        for suffix in ("*_pbp.csv", "*_pbp.csv.gz")
+        for path in glob(os.path.join(args.root, "**", suffix), recursive=True)
+    )
     print(f"Found {len(files)} files. Reading…")
 
-    dataframes = []
-    for path in files:
-        df = robust_read_csv(path, debug=args.debug)
-        if df is None:
-            print(f"⚠️  Skipped (unreadable after robust attempts): {path}")
-            if args.debug:
-                print("----- DEBUG PREVIEW (first ~400 chars) -----")
-                print(preview(path))
-                print("-------------------------------------------")
-            continue
-
-        # Add lightweight provenance columns (year/team from filename if possible)
-        base = os.path.basename(path)
-        year, team = None, None
-        try:
-            # e.g., wnba_2021_Aces_pbp.csv
-            parts = base.split("_")
-            if len(parts) >= 4 and parts[0] == "wnba":
-                year = parts[1]
-                team = parts[2]
-        except Exception:
-            pass
-        if year is not None:
-            df["_year"] = year
-        if team is not None:
-            df["_team_from_path"] = team
-        df["_source_file"] = os.path.relpath(path, args.root)
-
-        dataframes.append(df)
-
-    if not dataframes:
-        print("⚠️  Nothing to merge after reading files.")
-        return
-
-    # Union of columns, preserve order by first occurrence
-    # pd.concat with sort=False keeps first-seen order for columns encountered
-    merged = pd.concat(dataframes, ignore_index=True, sort=False)
-
-    # Write out
+    # CSV parsing is CPU-bound; read files across worker processes
+    workers = max(1, min(os.cpu_count() or 1, len(files)))
     out_path = args.output
-    merged.to_csv(out_path, index=False)
-    print(f"✅ Wrote {len(merged):,} rows to {out_path}")
+    total = 0
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        # Union of columns from the headers alone, preserve order by first occurrence
+        headers, fmts = zip(*ex.map(read_columns, files, repeat(args.root))) if files else ((), ())
+        columns = list(dict.fromkeys(c for cols in headers if cols is not None for c in cols))
+        if not columns:
+            print("⚠️  Nothing to merge after reading files.")
+            return
+
+        # Stream each file's rows out under the union header as it is parsed; only a small window of
+        # parsed frames is alive at any time instead of every file at once.
+        with open(out_path, "w", newline="", encoding="utf-8") as f:
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+            for path, df in read_in_order(ex, files, fmts, args.root, args.debug, window=2 * workers):
+                if df is None:
+                    print(f"⚠️  Skipped (unreadable after robust attempts): {path}")
+                    if args.debug:
+                        print("----- DEBUG PREVIEW (first ~400 chars) -----")
+                        print(preview(path))
+                        print("-------------------------------------------")
+                    continue
+                missing = df.columns.difference(columns)
+                if len(missing):
+                    print(f"⚠️  Dropping columns not seen in any header from {path}: {list(missing)}")
+                df.reindex(columns=columns).to_csv(f, index=False, header=False)
+                total += len(df)
+    print(f"✅ Wrote {total:,} rows to {out_path}")
+
+
+class TestMergeWnbaYears(unittest.TestCase):
+    """
+    Tests the streamed merge against the column labels pandas gives duplicate and unnamed headers.
+    """
+    def test_mangle_columns_matches_pandas(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "h.csv")
+            with open(path, "w") as f:
+                f.write("a,a,,a.1,a,b\n")
+            expected = list(pd.read_csv(path).columns)
+        self.assertEqual(mangle_columns(["a", "a", "", "a.1", "a", "b"]), expected)
+
+    def test_merge_duplicate_and_unnamed_headers(self):
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "2021"))
+            os.makedirs(os.path.join(root, "2022"))
+            with open(os.path.join(root, "2021", "wnba_2021_Aces_pbp.csv"), "w") as f:
+                f.write(",GAME_ID,X,X\n0,1,a,b\n1,2,c,d\n")
+            with open(os.path.join(root, "2022", "wnba_2022_Sky_pbp.csv"), "w") as f:
+                f.write("GAME_ID,X\n3,e\n")
+            out_path = os.path.join(root, "merged.csv")
+            argv = ["merge_wnba_years.py", "--root", root, "--output", out_path]
+            with mock.patch.object(sys, "argv", argv):
+                main()
+            merged = pd.read_csv(out_path, dtype=str, keep_default_na=False)
+
+        self.assertEqual(list(merged.columns),
+                         ["Unnamed: 0", "GAME_ID", "X", "X.1", "_year", "_team_from_path", "_source_file"])
+        self.assertEqual(merged["Unnamed: 0"].tolist(), ["0", "1", ""])
+        self.assertEqual(merged["X"].tolist(), ["a", "c", "e"])
+        self.assertEqual(merged["X.1"].tolist(), ["b", "d", ""])
 
 
 if __name__ == "__main__":
@@ -1,100 +1,87 @@
 #!/usr/bin/env python3
 import argparse
-import re
-from collections import Counter
 
+import numpy as np
 import pandas as pd
 
 
 LOWER_BOUND = 90  # minutes
 UPPER_BOUND = 180  # minutes
 
-
-TIME_REGEX = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*([AP]M)\s*$", re.IGNORECASE)
-
-
-def parse_clock_to_minutes(s: str):
-    """Parse 'H:MM AM/PM' -> minutes since midnight. Return None if unparsable."""
-    if not isinstance(s, str):
-        return None
-    s = s.strip()
-    if not s:
-        return None
-    m = TIME_REGEX.match(s)
-    if not m:
-        return None
-    hh = int(m.group(1))
-    mm = int(m.group(2))
-    ampm = m.group(3).upper()
-    hh = hh % 12  # 12 -> 0 for AM/PM math
-    if ampm == "PM":
-        hh += 12
-    return hh * 60 + mm
+TEAM_COLS = [
+    "PLAYER1_TEAM_ABBREVIATION",
+    "PLAYER2_TEAM_ABBREVIATION",
+    "PLAYER3_TEAM_ABBREVIATION",
+]
+
+
+def parse_clock_to_minutes(s: pd.Series) -> pd.Series:
+    """Parse 'H:MM AM/PM' strings -> minutes since midnight (float); NaN where unparsable."""
+    # Few distinct strings (one per minute of the day): parse the uniques once, then map back by code
+    codes, uniques = pd.factorize(s.astype(str))
+    # Drop spaces so '8:24 PM', '8:24PM' and ' 8:24 pm ' all match one fixed format
+    t = pd.to_datetime(
+        pd.Series(uniques).str.upper().str.replace(" ", "", regex=False),
+        format="%I:%M%p",
+        errors="coerce",
+    )
+    minutes = (t.dt.hour * 60 + t.dt.minute).to_numpy(float, na_value=np.nan)
+    return pd.Series(minutes[codes], index=s.index)
+
+
+def guess_teams(df: pd.DataFrame) -> pd.Series:
+    """Heuristic: per game, pick two most frequent team abbreviations across PLAYER*_TEAM_ABBREVIATION."""
+    cols = [c for c in TEAM_COLS if c in df.columns]
+    if not cols:
+        return pd.Series(dtype=object)
+    # Long form, column by column, so row order matches the old per-column Counter updates
+    long = pd.concat(
+        [pd.DataFrame({"GAME_ID": df["GAME_ID"], "team": df[c]}) for c in cols], ignore_index=True
+    ).dropna()
+    long["team"] = long["team"].astype(str).str.strip()
+    long = long[(long["team"] != "") & (long["team"].str.lower() != "nan")]
+
+    # Count per (game, team); ties go to the team seen first, as Counter.most_common did
+    long["order"] = np.arange(len(long))
+    counts = long.groupby(["GAME_ID", "team"], sort=False, observed=True).agg(n=("order", "size"), first=("order", "min"))
+    top2 = (
+        counts.sort_values(["n", "first"], ascending=[False, True], kind="mergesort")
+        .reset_index()
+        .groupby("GAME_ID", sort=False, observed=True)
+        .head(2)
+    )
+    return top2.groupby("GAME_ID", sort=False, observed=True)["team"].agg(" @ ".join)
 
 
-def first_last_valid_times(g: pd.DataFrame):
-    """Return (start_time_str, end_time_str, duration_min) from WCTIMESTRING within a game."""
-    times = g["WCTIMESTRING"].astype(str)
+def summarize_games(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-game summary (teams, periods, first/last valid WCTIMESTRING, duration, row count) via groupby aggregations."""
+    gid = df["GAME_ID"]
+    by_game = df.groupby("GAME_ID", sort=False, observed=True)
+    out = pd.DataFrame(index=by_game.size().index)
 
-    # Keep only non-empty, parsable strings (but preserve original first/last string forms)
-    parsed = []
-    for s in times:
-        m = parse_clock_to_minutes(s)
-        if m is not None:
-            parsed.append((s, m))
+    out["teams"] = guess_teams(df).reindex(out.index, fill_value="")
 
-    if not parsed:
-        return (None, None, None)
+    if "PERIOD" in df.columns:
+        periods = pd.to_numeric(df["PERIOD"], errors="coerce").groupby(gid, sort=False, observed=True).max()
+        out["periods"] = periods.fillna(0).astype(int)
+    else:
+        out["periods"] = 0
 
-    start_str, start_min = parsed[0]
-    end_str, end_min = parsed[-1]
+    # First/last parsable time per game (but preserve original first/last string forms)
+    times = df["WCTIMESTRING"].astype(str)
+    minutes = parse_clock_to_minutes(times)
+    valid = minutes.notna()
+    by_valid = pd.DataFrame({"time_str": times[valid], "minutes": minutes[valid]}).groupby(gid[valid], sort=False, observed=True)
+    first, last = by_valid.first(), by_valid.last()
+    out["start_time_str"] = first["time_str"]
+    out["end_time_str"] = last["time_str"]
 
-    duration = end_min - start_min
+    duration = last["minutes"] - first["minutes"]
     # If negative, assume we crossed midnight (very rare; just to be safe)
-    if duration < 0:
-        duration += 24 * 60
-
-    return (start_str, end_str, float(duration))
-
-
-def guess_teams(g: pd.DataFrame):
-    """Heuristic: pick two most frequent team abbreviations across PLAYER*_TEAM_ABBREVIATION."""
-    cols = [
-        "PLAYER1_TEAM_ABBREVIATION",
-        "PLAYER2_TEAM_ABBREVIATION",
-        "PLAYER3_TEAM_ABBREVIATION",
-    ]
-    cnt = Counter()
-    for c in cols:
-        if c in g.columns:
-            vals = g[c].dropna().astype(str).str.strip()
-            for v in vals:
-                if v and v.lower() != "nan":
-                    cnt[v] += 1
-    if not cnt:
-        return ""
-    common = [t for t, _ in cnt.most_common(2)]
-    if len(common) == 1:
-        return common[0]
-    return f"{common[0]} @ {common[1]}"
-
-
-def derive_game_summary(g: pd.DataFrame):
-    start_s, end_s, dur = first_last_valid_times(g)
-    row_count = len(g)
-    periods = int(pd.to_numeric(g.get("PERIOD", pd.Series([None])), errors="coerce").max() or 0)
-    teams = guess_teams(g)
-    return pd.Series(
-        {
-            "GAME_ID": g.name,
-            "teams": teams,
-            "periods": periods,
-            "start_time_str": start_s,
-            "end_time_str": end_s,
-            "duration_min": dur,
-            "row_count": row_count,
-        }
-    )
+    out["duration_min"] = duration.where(duration >= 0, duration + 24 * 60)
+
+    out["row_count"] = by_game.size()
+    return out.rename_axis("GAME_ID").reset_index()
 
 
 def main():
@@ -112,9 +99,14 @@ def main():
     if "GAME_ID" not in df.columns or "WCTIMESTRING" not in df.columns:
         raise ValueError("Input file must contain 'GAME_ID' and 'WCTIMESTRING' columns.")
 
+    # Game ids and team abbreviations repeat across many rows: group on integer category codes
+    for c in ["GAME_ID", *TEAM_COLS]:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+
     # Build per-game summary
     print("Building per-game summaries…")
-    summaries = df.groupby("GAME_ID", sort=False).apply(derive_game_summary).reset_index(drop=True)
+    summaries = summarize_games(df)
 
     # Flag outliers using fixed bounds
     outlier_mask = (
@@ -122,8 +114,7 @@ def main():
         | (summaries["duration_min"] < LOWER_BOUND)
         | (summaries["duration_min"] > UPPER_BOUND)
     )
-    outliers = summaries[outlier_mask].copy()
-    keepers = summaries[~outlier_mask].copy()
+    outliers = summaries[outlier_mask]
 
     total_games = len(summaries)
     num_outliers = len(outliers)
@@ -141,8 +132,11 @@ def main():
     print(f"📝 Wrote per-game summary to: {args.summary_out}")
 
     # Write cleaned PBP (remove outlier games)
-    bad_ids = set(outliers["GAME_ID"].tolist())
-    cleaned = df[~df["GAME_ID"].isin(bad_ids)].copy()
+    # Compare integer category codes rather than hashing every row's GAME_ID
+    gid = df["GAME_ID"].cat
+    bad_codes = gid.categories.get_indexer(outliers["GAME_ID"].unique())
+    keep = ~np.isin(gid.codes.to_numpy(), bad_codes)
+    cleaned = df.loc[keep]
     cleaned.to_csv(args.cleaned_out, index=False)
     print(f"✅ Wrote cleaned PBP to: {args.cleaned_out}  (rows kept: {len(cleaned):,})")
 
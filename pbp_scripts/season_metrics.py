@@ -4,111 +4,128 @@ import warnings
 warnings.filterwarnings("ignore")  # keep terminal quiet
 
 import re
-from datetime import datetime, timedelta
-from typing import Optional, Tuple, List
+from typing import Tuple, List
 
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401  (optional: Arrow-backed strings for the description scans)
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
 
 # -----------------------------
 # Parsing and utility functions
 # -----------------------------
 
 TIME_FMT = "%I:%M %p"  # e.g., "8:24 PM"
+DAY_SECONDS = 24 * 3600
 
-def parse_wc_time(s: str) -> Optional[datetime]:
-    """Parse WCTIMESTRING (time-of-day) into a datetime (date-less; we’ll anchor to Jan 1)."""
-    if pd.isna(s):
-        return None
-    s = str(s).strip()
-    if not s:
-        return None
+def parse_wc_seconds(wc: pd.Series) -> pd.Series:
+    """Parse WCTIMESTRING (time-of-day, e.g. '8:24 PM') into seconds since midnight; NaN if unparsable."""
+    # At most a few thousand distinct strings (one per minute of the day): parse those, then map back.
+    codes, uniques = pd.factorize(wc)
     # Some rows show "8:24 PM EST" etc.; strip trailing zone text.
-    s = s.replace("EST", "").replace("EDT", "").replace("CST", "").replace("CDT", "")
-    s = re.sub(r"\s+", " ", s).strip()
-    try:
-        t = datetime.strptime(s, TIME_FMT)
-        # Anchor to an arbitrary date so we can do arithmetic; day=1.
-        t = t.replace(year=2000, month=1, day=1)
-        return t
-    except Exception:
-        return None
-
-def diff_seconds(t1: Optional[datetime], t2: Optional[datetime]) -> Optional[float]:
-    """Difference t2 - t1 in seconds, handling None and midnight rollover (assume +1 day at most)."""
-    if t1 is None or t2 is None:
-        return None
-    delta = (t2 - t1).total_seconds()
-    if delta < -12 * 3600:
-        # Rollover (e.g., 11:58 PM -> 12:02 AM next day)
-        t2 = t2 + timedelta(days=1)
-        delta = (t2 - t1).total_seconds()
-    return float(delta)
-
-def safe_mean(x: pd.Series) -> Optional[float]:
-    x = pd.to_numeric(x, errors="coerce").dropna()
-    return float(x.mean()) if len(x) else None
+    s = (
+        pd.Series(uniques, dtype="string")
+        .str.replace(r"EST|EDT|CST|CDT", "", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+    t = pd.to_datetime(s, format=TIME_FMT, errors="coerce")
+    lut = np.append((t.dt.hour * 3600 + t.dt.minute * 60).to_numpy(np.float32, na_value=np.nan), np.float32(np.nan))
+    # NaN rows have code -1, which picks the trailing NaN entry
+    return pd.Series(lut[codes], index=wc.index)
+
+def season_from_game_id(game_id: pd.Series) -> pd.Series:
+    """Season from the YY digits of a 10-digit GAME_ID (e.g. 1022400001 -> 2024); NaN if not numeric."""
+    gid = pd.to_numeric(game_id, errors="coerce")
+    yy = (gid // 100000) % 100
+    return pd.Series(np.where(yy >= 90, 1900 + yy, 2000 + yy), index=game_id.index).where(gid.notna())
+
+def monotonic_seconds(sec: pd.Series, game_ids: pd.Series) -> pd.Series:
+    """
+    Make time-of-day seconds monotonic across midnight per game.
 
+    A drop of more than 12 hours between consecutive valid times is treated as a rollover
+    (e.g., 11:58 PM -> 12:02 AM next day) and every later row of that game is shifted by
+    one day. Missing times stay NaN. Rows must already be in event order.
+    """
+    # Compare each row against the previous valid time of its game, then count rollovers so far.
+    prev = sec.groupby(game_ids).ffill()
+    rollover = prev.groupby(game_ids).diff().lt(-12 * 3600)
+    return sec.astype(np.float64) + DAY_SECONDS * rollover.groupby(game_ids).cumsum()
 
 # -----------------------------
 # Event detectors (robust regex)
 # -----------------------------
 
-def contains_any(text_series: pd.Series, patterns: List[str]) -> pd.Series:
-    """Case-insensitive substring search for any of the patterns."""
-    s = text_series.fillna("").astype(str)
+TEXT_COLS = ["HOMEDESCRIPTION", "NEUTRALDESCRIPTION", "VISITORDESCRIPTION"]
+
+# Arrow strings run str.lower/str.contains in C++ kernels instead of per-object Python calls.
+TEXT_DTYPE = "string[pyarrow]" if HAVE_PYARROW else object
+
+def event_text(df: pd.DataFrame) -> pd.Series:
+    """Lower-cased 'home|neutral|visitor' description per row, so each detector is one scan."""
+    cols = [df[c].astype(TEXT_DTYPE).fillna("") if c in df.columns else pd.Series("", index=df.index, dtype=TEXT_DTYPE)
+            for c in TEXT_COLS]
+    return (cols[0] + "|" + cols[1] + "|" + cols[2]).str.lower()
+
+def contains_any(text: pd.Series, patterns: List[str]) -> pd.Series:
+    """Substring search for any of the (lower-case) patterns in event_text() output."""
+    # A pattern containing another one can never add matches ("timeout" covers "full timeout").
+    patterns = [p for p in patterns if not any(q != p and q in p for q in patterns)]
+    # One or two literals: plain substring search beats the regex engine; more: one alternation.
+    if len(patterns) <= 2:
+        hit = text.str.contains(patterns[0], regex=False)
+        for p in patterns[1:]:
+            hit |= text.str.contains(p, regex=False)
+        return hit
     pat = "|".join([re.escape(pat) for pat in patterns])
-    return s.str.contains(pat, case=False, regex=True)
+    return text.str.contains(pat, regex=True)
 
-def flag_timeout(row_texts: List[pd.Series]) -> pd.Series:
+def flag_timeout(text: pd.Series) -> pd.Series:
     pats = ["timeout", "20-second timeout", "full timeout"]
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_challenge(row_texts: List[pd.Series]) -> pd.Series:
+def flag_challenge(text: pd.Series) -> pd.Series:
     pats = ["challenge", "coach's challenge", "coaches challenge", "coach challenge"]
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_replay(row_texts: List[pd.Series]) -> pd.Series:
+def flag_replay(text: pd.Series) -> pd.Series:
     pats = ["instant replay", "replay review", "reviewed", "review"]
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_foul(row_texts: List[pd.Series]) -> pd.Series:
+def flag_foul(text: pd.Series) -> pd.Series:
     # Many forms like "S.FOUL", "P.FOUL", "OFF.FOUL", "SHOOT.FOUL", etc.
     pats = ["foul"]
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_start_game(row_texts: List[pd.Series]) -> pd.Series:
+def flag_start_game(text: pd.Series) -> pd.Series:
     pats = ["start of 1st half", "start of 1st period", "start of first period",
             "start of game", "tip to "]  # last one helps when start marker missing
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_end_game(row_texts: List[pd.Series]) -> pd.Series:
+def flag_end_game(text: pd.Series) -> pd.Series:
     pats = ["end of game", "final", "end of 4th period", "end of 4th quarter"]
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_start_period(row_texts: List[pd.Series]) -> pd.Series:
+def flag_start_period(text: pd.Series) -> pd.Series:
     pats = ["start of", "start of 2nd period", "start of 3rd period", "start of 4th period",
             "start of 2nd half", "start of second half"]
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_end_period(row_texts: List[pd.Series]) -> pd.Series:
+def flag_end_period(text: pd.Series) -> pd.Series:
     pats = ["end of 1st period", "end of 2nd period", "end of 3rd period", "end of 4th period",
             "end of 1st half", "end of first half", "end of 2nd half"]
-    m = sum(contains_any(s, pats) for s in row_texts)
-    return (m > 0)
+    return contains_any(text, pats)
 
-def flag_half_markers(row_texts: List[pd.Series]) -> Tuple[pd.Series, pd.Series]:
+def flag_half_markers(text: pd.Series) -> Tuple[pd.Series, pd.Series]:
     """Return (end_of_first_half, start_of_second_half) boolean series."""
-    end_1st_half = sum(contains_any(s, ["end of 1st half", "end of first half"]) for s in row_texts) > 0
-    start_2nd_half = sum(contains_any(s, ["start of 2nd half", "start of second half"]) for s in row_texts) > 0
+    end_1st_half = contains_any(text, ["end of 1st half", "end of first half"])
+    start_2nd_half = contains_any(text, ["start of 2nd half", "start of second half"])
     return end_1st_half, start_2nd_half
 
 
@@ -116,165 +133,139 @@ def flag_half_markers(row_texts: List[pd.Series]) -> Tuple[pd.Series, pd.Series]
 # Per-game metric computation
 # -----------------------------
 
-def per_game_metrics(g: pd.DataFrame) -> Optional[pd.Series]:
+def first_time(wc: pd.Series, mask: pd.Series, game_ids: pd.Series) -> pd.Series:
+    """Time of the first flagged row per game (NaN if that row has no time); only games with a flagged row."""
+    return wc[mask].groupby(game_ids[mask], sort=False).first(skipna=False)
+
+def last_time(wc: pd.Series, mask: pd.Series, game_ids: pd.Series) -> pd.Series:
+    """Time of the last flagged row per game (NaN if that row has no time); only games with a flagged row."""
+    return wc[mask].groupby(game_ids[mask], sort=False).last(skipna=False)
+
+def marker_mask(markers: pd.Series, index: pd.Index, patterns: List[str]) -> pd.Series:
+    """contains_any() over pre-filtered boundary rows, expanded back to a full-frame mask."""
+    return contains_any(markers, patterns).reindex(index, fill_value=False)
+
+def mean_event_length(wc: pd.Series, mask: pd.Series, game_ids: pd.Series,
+                      lo: float, hi: float) -> pd.Series:
+    """
+    Per-game mean seconds from each flagged row to the next unflagged row that has a time,
+    keeping only plausible lengths in [lo, hi]. Rows must be grouped contiguously by game.
+    """
+    t = wc.to_numpy(np.float64)
+    flagged = np.asarray(mask, dtype=bool)
+    codes = pd.factorize(game_ids)[0]
+
+    # Binary-search each flagged row's next candidate among unflagged, timed rows.
+    starts = np.flatnonzero(flagged)
+    ok_pos = np.flatnonzero(~flagged & ~np.isnan(t))
+    k = np.searchsorted(ok_pos, starts + 1)
+    has_next = k < len(ok_pos)
+    nxt = ok_pos[np.minimum(k, len(ok_pos) - 1)] if len(ok_pos) else starts
+    same_game = has_next & (codes[nxt] == codes[starts])
+
+    sec = pd.Series(np.where(same_game, t[nxt] - t[starts], np.nan))
+    keep = sec.between(lo, hi).to_numpy()
+    return sec[keep].groupby(game_ids.to_numpy()[starts[keep]], sort=False).mean()
+
+def game_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Compute metrics for a single GAME_ID.
+    Compute metrics for every GAME_ID at once, one row per game.
     Expects columns:
-      - GAME_ID, PERIOD (int), WCTIMESTRING (e.g. '8:24 PM'), PCTIMESTRING
+      - GAME_ID, PERIOD (int), EVENTNUM, _wc_sec (seconds since midnight, see load_pbp)
       - HOMEDESCRIPTION, NEUTRALDESCRIPTION, VISITORDESCRIPTION
       - _year (season)
     """
-    # Fast sanity checks
-    if g.empty:
-        return None
-
-    # Normalize and parse wall-clock times
-    g = g.sort_values(["PERIOD", "EVENTNUM"], kind="mergesort").reset_index(drop=True)
-
-    # Text columns
-    hd = g.get("HOMEDESCRIPTION", pd.Series(dtype=object))
-    nd = g.get("NEUTRALDESCRIPTION", pd.Series(dtype=object))
-    vd = g.get("VISITORDESCRIPTION", pd.Series(dtype=object))
-    text_cols = [hd, nd, vd]
-
-    # Parse WCTIMESTRING
-    wc = g.get("WCTIMESTRING", pd.Series(dtype=object)).apply(parse_wc_time)
-
-    # Season/year
-    season = g.get("_year").iloc[0] if "_year" in g.columns else np.nan
+    # Event order within each game; one sort for the whole frame.
+    df = df.sort_values(["GAME_ID", "PERIOD", "EVENTNUM"], kind="mergesort", ignore_index=True)
+    gid = df["GAME_ID"]
+
+    # Text columns, combined and lower-cased once
+    text = event_text(df)
+    # Period/half boundary markers are a handful of rows per game: find them in one scan,
+    # then search only those rows for each specific marker.
+    markers = text[contains_any(text, ["start of", "end of"])]
+
+    # Wall-clock seconds, continuous across midnight
+    wc = monotonic_seconds(df["_wc_sec"], gid)
+
+    by_game = wc.groupby(gid, sort=False)
+    first_valid = by_game.first()
+    last_valid = by_game.last()
+    games = first_valid.index
+
+    # Season/year; fall back to the GAME_ID season digits where _year is missing
+    id_season = season_from_game_id(pd.Series(games, index=games))
+    if "_year" in df.columns:
+        season = df["_year"].groupby(gid, sort=False).first(skipna=False).fillna(id_season)
+    else:
+        season = id_season
+    # Roughly 30 distinct seasons: a nullable small int instead of float64
+    season = pd.to_numeric(season, errors="coerce").astype("Int16")
 
     # --- Game duration ---
     # Start candidate: first "start" marker; else first non-empty WCTIMESTRING
-    start_mask = flag_start_game(text_cols)
-    if start_mask.any():
-        t_start = wc[start_mask].iloc[0]
-    else:
-        t_start = wc.dropna().iloc[0] if wc.notna().any() else None
+    t_start = first_valid.copy()
+    marked = first_time(wc, flag_start_game(text), gid)
+    t_start.loc[marked.index] = marked
 
     # End candidate: last "end of game" or last event time
-    end_mask = flag_end_game(text_cols)
-    if end_mask.any():
-        t_end = wc[end_mask].iloc[-1]
-    else:
-        t_end = wc.dropna().iloc[-1] if wc.notna().any() else None
+    end_mask = flag_end_game(text)
+    t_end = last_valid.copy()
+    t_end_game = last_time(wc, end_mask, gid)  # reused for the halves-era 2nd-half length below
+    t_end.loc[t_end_game.index] = t_end_game
 
-    game_duration_min = None
-    ds = diff_seconds(t_start, t_end)
-    if ds is not None and ds >= 0:
-        game_duration_min = ds / 60.0
+    ds = t_end - t_start
+    game_duration_min = ds.where(ds >= 0) / 60.0
 
     # --- Timeouts & timeout length ---
-    timeout_mask = flag_timeout(text_cols)
-    timeouts = int(timeout_mask.sum())
-
-    timeout_lengths = []
-    if timeouts > 0:
-        idxs = list(np.where(timeout_mask)[0])
-        for i in idxs:
-            t0 = wc.iloc[i]
-            # length until next non-timeout event (use next event time that has a WCTIMESTRING)
-            j = i + 1
-            t1 = None
-            while j < len(wc):
-                if not timeout_mask.iloc[j] and wc.iloc[j] is not None:
-                    t1 = wc.iloc[j]
-                    break
-                j += 1
-            sec = diff_seconds(t0, t1)
-            # keep only plausible TV timeout window (15s..5min)
-            if sec is not None and 15 <= sec <= 300:
-                timeout_lengths.append(sec)
-
-    avg_timeout_len_sec = np.mean(timeout_lengths) if timeout_lengths else None
+    # Length until next non-timeout event with a WCTIMESTRING; keep only plausible
+    # TV timeout window (15s..5min).
+    timeout_mask = flag_timeout(text)
+    timeouts = timeout_mask.groupby(gid, sort=False).sum()
+    avg_timeout_len_sec = mean_event_length(wc, timeout_mask, gid, 15, 300)
 
     # --- Challenges ---
-    challenges = int(flag_challenge(text_cols).sum())
+    challenges = flag_challenge(text).groupby(gid, sort=False).sum()
 
     # --- Replays & replay length ---
-    replay_mask = flag_replay(text_cols)
-    replays = int(replay_mask.sum())
-
-    replay_lengths = []
-    if replays > 0:
-        ridxs = list(np.where(replay_mask)[0])
-        for i in ridxs:
-            t0 = wc.iloc[i]
-            # end at first subsequent non-replay, non-empty time
-            j = i + 1
-            t1 = None
-            while j < len(wc):
-                if not replay_mask.iloc[j] and wc.iloc[j] is not None:
-                    t1 = wc.iloc[j]
-                    break
-                j += 1
-            sec = diff_seconds(t0, t1)
-            # Plausible replay window (5s..180s); drop weird gaps across quarter breaks, etc.
-            if sec is not None and 5 <= sec <= 180:
-                replay_lengths.append(sec)
-
-    avg_replay_len_sec = np.mean(replay_lengths) if replay_lengths else None
+    # Plausible replay window (5s..180s); drop weird gaps across quarter breaks, etc.
+    replay_mask = flag_replay(text)
+    replays = replay_mask.groupby(gid, sort=False).sum()
+    avg_replay_len_sec = mean_event_length(wc, replay_mask, gid, 5, 180)
 
     # --- Halftime length (support halves OR quarters) ---
     # Prefer explicit half markers; else fall back to end of 2nd -> start of 3rd.
-    # End-of-1st-half
-    e1h = sum(contains_any(s, ["end of 1st half", "end of first half"]) for s in text_cols) > 0
-    s2h = sum(contains_any(s, ["start of 2nd half", "start of second half"]) for s in text_cols) > 0
-
-    halftime_len_min = None
-    if e1h.any() if hasattr(e1h, "any") else bool(e1h):
-        # Take last end-of-1st-half time and first start-of-2nd-half time
-        e_mask = sum(contains_any(s, ["end of 1st half", "end of first half"]) for s in text_cols) > 0
-        s_mask = sum(contains_any(s, ["start of 2nd half", "start of second half"]) for s in text_cols) > 0
-        t_e = wc[e_mask].iloc[-1] if wc[e_mask].notna().any() else None
-        t_s = wc[s_mask].iloc[0] if wc[s_mask].notna().any() else None
-        sec = diff_seconds(t_e, t_s)
-        if sec is not None and 120 <= sec <= 1800:  # 2–30 minutes
-            halftime_len_min = sec / 60.0
-    else:
-        # Quarters: End of 2nd Period -> Start of 3rd Period
-        e2_mask = sum(contains_any(s, ["end of 2nd period"]) for s in text_cols) > 0
-        s3_mask = sum(contains_any(s, ["start of 3rd period"]) for s in text_cols) > 0
-        if (e2_mask.any() if hasattr(e2_mask, "any") else bool(e2_mask)) and \
-           (s3_mask.any() if hasattr(s3_mask, "any") else bool(s3_mask)):
-            t_e = wc[e2_mask].iloc[-1] if wc[e2_mask].notna().any() else None
-            t_s = wc[s3_mask].iloc[0] if wc[s3_mask].notna().any() else None
-            sec = diff_seconds(t_e, t_s)
-            if sec is not None and 120 <= sec <= 1800:
-                halftime_len_min = sec / 60.0
+    e1h_mask = marker_mask(markers, text.index, ["end of 1st half", "end of first half"])
+    s2h_mask = marker_mask(markers, text.index, ["start of 2nd half", "start of second half"])
+    e2_mask = marker_mask(markers, text.index, ["end of 2nd period"])
+    s3_mask = marker_mask(markers, text.index, ["start of 3rd period"])
+
+    t_e1h = last_time(wc, e1h_mask, gid)
+    t_s2h = first_time(wc, s2h_mask, gid).reindex(games)
+    halves_sec = t_s2h - t_e1h.reindex(games)
+    quarters_sec = first_time(wc, s3_mask, gid).reindex(games) - last_time(wc, e2_mask, gid).reindex(games)
+    sec = halves_sec.where(games.isin(t_e1h.index), quarters_sec)
+    halftime_len_min = sec.where(sec.between(120, 1800)) / 60.0  # 2–30 minutes
 
     # --- Free throws (count events mentioning "free throw") ---
-    ft_mask = sum(contains_any(s, ["free throw"]) for s in text_cols) > 0
-    free_throws = int(ft_mask.sum())
+    ft_mask = contains_any(text, ["free throw"])
+    free_throws = ft_mask.groupby(gid, sort=False).sum()
 
     # --- Fouls (count rows mentioning "foul") ---
-    foul_mask = flag_foul(text_cols)
-    fouls = int(foul_mask.sum())
+    fouls = flag_foul(text).groupby(gid, sort=False).sum()
 
     # --- 4th quarter (or 2nd half) wall-clock length ---
-    q4_len_min = None
-    # Prefer Start of 4th Period -> End of 4th Period
-    s4_mask = sum(contains_any(s, ["start of 4th period", "start of 4th quarter"]) for s in text_cols) > 0
-    e4_mask = sum(contains_any(s, ["end of 4th period", "end of 4th quarter", "end of game"]) for s in text_cols) > 0
-    if (s4_mask.any() if hasattr(s4_mask, "any") else bool(s4_mask)) and \
-       (e4_mask.any() if hasattr(e4_mask, "any") else bool(e4_mask)):
-        t_s4 = wc[s4_mask].iloc[0] if wc[s4_mask].notna().any() else None
-        t_e4 = wc[e4_mask].iloc[-1] if wc[e4_mask].notna().any() else None
-        sec = diff_seconds(t_s4, t_e4)
-        if sec is not None and 60 <= sec <= 7200:
-            q4_len_min = sec / 60.0
-    else:
-        # For halves-era, approximate 2nd-half length
-        s2h_mask = sum(contains_any(s, ["start of 2nd half", "start of second half"]) for s in text_cols) > 0
-        end_game_mask = flag_end_game(text_cols)
-        if (s2h_mask.any() if hasattr(s2h_mask, "any") else bool(s2h_mask)) and \
-           (end_game_mask.any() if hasattr(end_game_mask, "any") else bool(end_game_mask)):
-            t_s2 = wc[s2h_mask].iloc[0] if wc[s2h_mask].notna().any() else None
-            t_eg = wc[end_game_mask].iloc[-1] if wc[end_game_mask].notna().any() else None
-            sec = diff_seconds(t_s2, t_eg)
-            if sec is not None and 60 <= sec <= 7200:
-                q4_len_min = sec / 60.0
-
-    return pd.Series({
+    # Prefer Start of 4th Period -> End of 4th Period; for halves-era, approximate 2nd-half length.
+    s4_mask = marker_mask(markers, text.index, ["start of 4th period", "start of 4th quarter"])
+    e4_mask = marker_mask(markers, text.index, ["end of 4th period", "end of 4th quarter", "end of game"])
+    t_s4 = first_time(wc, s4_mask, gid)
+    t_e4 = last_time(wc, e4_mask, gid)
+    quarter_sec = t_e4.reindex(games) - t_s4.reindex(games)
+    half_sec = t_end_game.reindex(games) - t_s2h
+    sec = quarter_sec.where(games.isin(t_s4.index) & games.isin(t_e4.index), half_sec)
+    q4_len_min = sec.where(sec.between(60, 7200)) / 60.0
+
+    return pd.DataFrame({
         "season": season,
         "game_duration_min": game_duration_min,
         "challenges": challenges,
@@ -286,53 +277,53 @@ def per_game_metrics(g: pd.DataFrame) -> Optional[pd.Series]:
         "free_throws": free_throws,
         "q4_wall_minutes": q4_len_min,
         "fouls": fouls,
-    })
+    }, index=games).rename_axis("GAME_ID").reset_index()
 
 
 # -----------------------------
 # CLI / main
 # -----------------------------
 
+def load_pbp(path: str) -> pd.DataFrame:
+    """Read the play-by-play columns we use, parsing WCTIMESTRING once into _wc_sec."""
+    # Read only columns we use for speed; text columns are declared so pandas skips type inference.
+    usecols = [
+        "GAME_ID","EVENTNUM","PERIOD",
+        "WCTIMESTRING","HOMEDESCRIPTION","NEUTRALDESCRIPTION","VISITORDESCRIPTION",
+        "_year"
+    ]
+    dtypes = {"WCTIMESTRING": str, **{c: TEXT_DTYPE for c in TEXT_COLS}}
+    # A callable usecols skips absent columns without a separate header-probe read.
+    wanted = set(usecols)
+    df = pd.read_csv(path, usecols=lambda c: c in wanted, dtype=dtypes)
+
+    # Basic cleaning
+    df["PERIOD"] = pd.to_numeric(df.get("PERIOD"), errors="coerce").fillna(0).astype(np.int8)
+    if "_year" in df.columns:
+        df["_year"] = pd.to_numeric(df["_year"], errors="coerce").astype("Int16")
+
+    # float32 seconds instead of the raw strings; the text column is not needed afterwards.
+    wc = df.pop("WCTIMESTRING") if "WCTIMESTRING" in df.columns else pd.Series(index=df.index, dtype=object)
+    df["_wc_sec"] = parse_wc_seconds(wc)
+    return df
+
+
 def main():
     ap = argparse.ArgumentParser(description="Aggregate WNBA per-season game-duration metrics.")
     ap.add_argument("--input", required=True, help="Path to wnba_data_clean.csv (play-by-play).")
     ap.add_argument("--output", required=True, help="Path to write season_metrics.csv.")
     ap.add_argument("--show", type=int, default=0, help="Print first N season rows after write.")
-    ap.add_argument("--progress-every", type=int, default=1000, help="Progress print frequency by games.")
+    ap.add_argument("--progress-every", type=int, default=1000,
+                    help="Ignored; all games are computed in one pass. Kept for compatibility.")
     ap.add_argument("--duration-bounds", type=str, default="",
                     help="Optional filter like '90,180' to keep only games with duration in [min,max] minutes.")
     args = ap.parse_args()
 
     print(f"Reading PBP: {args.input}")
-    # Read only columns we use for speed
-    usecols = [
-        "GAME_ID","EVENTNUM","EVENTMSGTYPE","EVENTMSGACTIONTYPE","PERIOD",
-        "WCTIMESTRING","PCTIMESTRING","HOMEDESCRIPTION","NEUTRALDESCRIPTION","VISITORDESCRIPTION",
-        "_year"
-    ]
-    df = pd.read_csv(args.input, usecols=[c for c in usecols if c in pd.read_csv(args.input, nrows=0).columns])
-
-    # Basic cleaning
-    df["PERIOD"] = pd.to_numeric(df.get("PERIOD"), errors="coerce").fillna(0).astype(int)
+    df = load_pbp(args.input)
 
-    # Process per game with periodic progress output
-    game_ids = df["GAME_ID"].dropna().unique().tolist()
-    n_games = len(game_ids)
-    print(f"Found {n_games} games. Computing metrics…")
-
-    rows = []
-    for i, gid in enumerate(game_ids, 1):
-        g = df.loc[df["GAME_ID"] == gid]
-        try:
-            row = per_game_metrics(g)
-            if row is not None:
-                rows.append(row)
-        except Exception as e:
-            print(f"  ! Skipped GAME_ID {gid} due to error: {e}")
-        if args.progress_every and (i % args.progress_every == 0 or i == n_games):
-            print(f"  … processed {i}/{n_games} games")
-
-    per_game_df = pd.DataFrame(rows)
+    print(f"Found {df['GAME_ID'].nunique()} games. Computing metrics…")
+    per_game_df = game_metrics(df)
 
     # Optional duration filter
     if args.duration_bounds:
@@ -347,29 +338,26 @@ def main():
         except Exception:
             print("  (ignored --duration-bounds; must be like '90,180')")
 
-    # Season aggregation
-    def _mean(series): return safe_mean(series)
-
+    # Season aggregation: per-game metrics are already numeric, so one built-in grouped mean (NaN-skipping)
+    season_cols = {
+        "game_duration_min": "Average Game Duration (min)",
+        "challenges": "Average Challenges Per Game",
+        "timeouts": "Average Timeouts Per Game",
+        "avg_timeout_len_sec": "Average Timeout Length (seconds)",
+        "replays": "Average Replays Per Game",
+        "avg_replay_len_sec": "Average Replay Length (seconds)",
+        "halftime_len_min": "Average Halftime Length (minutes)",
+        "free_throws": "Free Throws Per Game",
+        "q4_wall_minutes": "4th Quarter Length (minutes)",
+        "fouls": "Average Fouls Per Game",
+    }
     season_table = (
         per_game_df
-        .groupby("season", dropna=True)
-        .agg(
-            **{
-                "Average Game Duration (min)": ("game_duration_min", _mean),
-                "Average Challenges Per Game": ("challenges", _mean),
-                "Average Timeouts Per Game": ("timeouts", _mean),
-                "Average Timeout Length (seconds)": ("avg_timeout_len_sec", _mean),
-                "Average Replays Per Game": ("replays", _mean),
-                "Average Replay Length (seconds)": ("avg_replay_len_sec", _mean),
-                "Average Halftime Length (minutes)": ("halftime_len_min", _mean),
-                "Free Throws Per Game": ("free_throws", _mean),
-                "4th Quarter Length (minutes)": ("q4_wall_minutes", _mean),
-                "Average Fouls Per Game": ("fouls", _mean),
-            }
-        )
+        .groupby("season", dropna=True, sort=True)[list(season_cols)]
+        .mean()
+        .rename(columns=season_cols)
         .reset_index()
         .rename(columns={"season": "Season"})
-        .sort_values("Season")
     )
 
     # Tidy types
@@ -6,29 +6,46 @@ import argparse
 import requests
 import os
 import pickle
+import json
 import signal
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ReadTimeout
 from nba_api.stats.endpoints import leaguegamefinder
 from nba_api.stats.endpoints import playbyplayv2
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.static import teams
 
 # Base Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) # Directory of the current script file
 DATA_ROOT = os.path.join(SCRIPT_DIR, "..", "pbp_data") # Root directory for play-by-play data.
 CHECKPOINTS_ROOT = os.path.join(SCRIPT_DIR, "..", "checkpoints") # Directory for saving progress checkpoints.
+GAME_CACHE_ROOT = os.path.join(SCRIPT_DIR, "..", "pbp_cache") # Per-game downloads, reused across runs.
 
 # API Settings
 DEFAULT_TIMEOUT = 30
-MIN_DELAY = 2
-MAX_DELAY = 6
-TEAM_DELAY_MIN = 3
-TEAM_DELAY_MAX = 5
+REQUESTS_PER_SECOND = 1.0 # Global request rate shared by all fetch workers.
+MAX_WORKERS = 4 # Concurrent game fetches per team.
+
+# Output settings
+COMPRESS_PBP_FILES = True # Save team-season files as gzipped CSV (.csv.gz); False writes plain .csv.
+PBP_FILE_SUFFIXES = (".csv.gz", ".csv") # Either format counts as an existing team-season file.
+# Level 1 gets most of the size reduction on repetitive PBP text for a fraction of the CPU; mtime 0 keeps output reproducible.
+GZIP_OPTIONS = {"method": "gzip", "compresslevel": 1, "mtime": 0}
+WRITE_BUFFER_SIZE = 1 << 20 # 1 MiB file buffer so the CSV writer issues few large writes instead of many 8 KiB ones.
+# Text columns read back as strings; GAME_ID keeps its leading zeros, matching freshly fetched frames.
+PBP_DTYPES = {col: str for col in ["GAME_ID", "WCTIMESTRING", "PCTIMESTRING", "HOMEDESCRIPTION", "NEUTRALDESCRIPTION",
+                                   "VISITORDESCRIPTION", "SCORE", "SCOREMARGIN"]}
 
 # Retry settings
 MAX_ATTEMPTS = 2
+BACKOFF_BASE = 1 # Seconds; the retry delay window doubles per attempt.
+BACKOFF_CAP = 60 # Upper bound of the retry delay window in seconds.
 
 # State for session
-CURRENT_PBP_DATA = pd.DataFrame()  
+CURRENT_PBP_FRAMES = [] # Per-game frames collected so far for the current team.
 CURRENT_SEASON = ""
 CURRENT_TEAM_NAME = ""
 CURRENT_FAILED_GAMES = []
@@ -42,89 +59,109 @@ LEAGUE_IDS = {
     "g_league": "20"
 }
 
+def build_session() -> requests.Session:
+    """Creates a keep-alive session so requests reuse pooled connections instead of a new TCP/TLS handshake each."""
+    session = requests.Session()
+    # One pooled connection per fetch worker (plus headroom); retries are handled by the fetch functions.
+    session.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS * 2, max_retries=0))
+    return session
+
+# Every nba_api endpoint (PlayByPlayV2, LeagueGameFinder) sends its requests through this shared session.
+NBAStatsHTTP.set_session(build_session())
+
+class RateLimiter:
+    """Token bucket shared across threads: allows `rate` requests per second on average, bursting up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a request token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            # Sleep outside the lock so other workers can refill/check the bucket.
+            time.sleep(wait)
+
+# Paces every API request (games and game-id lookups) globally, regardless of how many workers are fetching.
+RATE_LIMITER = RateLimiter(REQUESTS_PER_SECOND)
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C by saving checkpoint before exiting."""
     print("\nCtrl+C detected! Saving checkpoint before exiting...", flush=True)
-    if not CURRENT_PBP_DATA.empty and CURRENT_SEASON and CURRENT_TEAM_NAME:
-        save_checkpoint(CURRENT_PBP_DATA, CURRENT_SEASON, CURRENT_TEAM_NAME, CURRENT_LEAGUE, CURRENT_FAILED_GAMES, CURRENT_EMPTY_GAMES)
+    if CURRENT_PBP_FRAMES and CURRENT_SEASON and CURRENT_TEAM_NAME:
+        save_checkpoint(combine_frames(CURRENT_PBP_FRAMES), CURRENT_SEASON, CURRENT_TEAM_NAME, CURRENT_LEAGUE, CURRENT_FAILED_GAMES, CURRENT_EMPTY_GAMES)
         print(f"Checkpoint saved for {CURRENT_TEAM_NAME} in season {CURRENT_SEASON}.", flush=True)
     else:
         print("No data to save in checkpoint.", flush=True)
     print("Exiting program.", flush=True)
     exit(0)
 
-def reset_connections():
-    """Force close and reset all connection pools and TCP sockets"""
-    print("🔄 Forcefully resetting all connection pools and sockets...", flush=True)
+def combine_frames(frames: list) -> pd.DataFrame:
+    """Concatenates the collected per-game frames once (an empty DataFrame if there are none)."""
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
-    try:
-        # Reset the underlying requests connection pools
-        import requests
-        for session in [requests.Session(), requests.sessions.Session()]:
-            for adapter in session.adapters.values():
-                adapter.close()
-        
-        # Reset the underlying urllib3 connection pools that requests uses
-        import urllib3
-        urllib3.disable_warnings()
-        try:
-            pool_manager = urllib3.PoolManager()
-            pool_manager.clear()
-            for conn in pool_manager.pools.values():
-                conn.close()
-        except:
-            pass
-            
-        # Force garbage collection to release any lingering connections
-        import gc
-        gc.collect()
-        
-        print("✅ Connection pools reset successfully", flush=True)
-        return True
-    except Exception as e:
-        print(f"⚠️ Error resetting connections: {e}", flush=True)
-        return False
-    
-def restart_script():
-    """Restart the script in a new process with the same arguments"""
-    import sys
-    import os
-    import subprocess
-    
-    print("🔄 Restarting script in a new process...", flush=True)
-    
-    # Get the current script path and arguments
-    script_path = os.path.abspath(__file__)
-    args = sys.argv[1:]
-    
-    # Convert arguments to a string
-    args_str = " ".join(args)
-    
-    # Create a new process
-    try:
-        # Using subprocess.Popen to start without waiting
-        print(f"Executing: python \"{script_path}\" {args_str}", flush=True)
-        subprocess.Popen(f"python \"{script_path}\" {args_str}", shell=True)
-        print("New process started successfully. Exiting current process.", flush=True)
-        # Exit the current process
-        sys.exit(0)
-    except Exception as e:
-        print(f"Failed to restart script: {e}", flush=True)
-        return False
+def reset_connections():
+    """Closes the shared nba_api session and installs a fresh one, dropping every pooled connection."""
+    print("🔄 Recycling the shared HTTP session...", flush=True)
+    NBAStatsHTTP.get_session().close()
+    NBAStatsHTTP.set_session(build_session())
 
-def completed_pbp_file_exists(season: str, team_name: str, league: str) -> bool:
+def find_completed_pbp_file(season: str, team_name: str, league: str) -> str:
     """
-    Checks if the play-by-play (PBP) data file exists for a given season and team.
+    Finds the saved play-by-play data file for a given season and team, gzipped or plain CSV.
 
     Args:
         season (str): The season identifier (e.g., "2022-23").
         team_name (str): The name of the team.
 
     Returns:
-        bool: True if the PBP data file exists, False otherwise.
+        str: The path of the existing file, or None if neither format exists.
     """
-    _, file_path = get_completed_pbp_data_filepath(season, team_name, league)
-    return os.path.exists(file_path)
+    directory, _ = get_completed_pbp_data_filepath(season, team_name, league)
+    for suffix in PBP_FILE_SUFFIXES:
+        file_path = os.path.join(directory, f"{league}_{season}_{team_name}_pbp{suffix}")
+        if os.path.exists(file_path):
+            return file_path
+    return None
+
+def find_completed_teams(season: str, league: str) -> set:
+    """
+    Lists the teams whose play-by-play data file already exists for a season, with a single directory scan.
+
+    Args:
+        season (str): The season identifier (e.g., "2022-23").
+        league (str): 'nba' or 'wnba'.
+
+    Returns:
+        set: The team nicknames that have a saved file (gzipped or plain CSV).
+    """
+    directory = os.path.join(DATA_ROOT, league, season)
+    prefix = f"{league}_{season}_"
+    try:
+        with os.scandir(directory) as entries:
+            names = [entry.name for entry in entries if entry.is_file()]
+    except FileNotFoundError:
+        return set()
+
+    completed = set()
+    for name in names:
+        for suffix in PBP_FILE_SUFFIXES:
+            ending = f"_pbp{suffix}"
+            if name.startswith(prefix) and name.endswith(ending):
+                completed.add(name[len(prefix):-len(ending)])
+                break
+    return completed
 
 def checkpoint_file_exists(season: str, team_name: str, league: str) -> bool:
     """
@@ -142,7 +179,7 @@ def checkpoint_file_exists(season: str, team_name: str, league: str) -> bool:
 
 def get_completed_pbp_data_filepath(season: str, team_name: str, league: str) -> tuple:
     """
-    Constructs the file path for the play-by-play data CSV file.
+    Constructs the file path for the play-by-play data CSV file (.csv.gz when COMPRESS_PBP_FILES is set).
 
     Args:
         team_name (str): The nickname of the team.
@@ -152,7 +189,8 @@ def get_completed_pbp_data_filepath(season: str, team_name: str, league: str) ->
         tuple: A tuple containing the directory and file path.
     """
     directory = os.path.join(DATA_ROOT, league, season)
-    file_name = f"{league}_{season}_{team_name}_pbp.csv"
+    suffix = ".csv.gz" if COMPRESS_PBP_FILES else ".csv"
+    file_name = f"{league}_{season}_{team_name}_pbp{suffix}"
     file_path = os.path.join(directory, file_name)
     return directory, file_path
 
@@ -172,6 +210,35 @@ def get_checkpoint_filepath(season: str, team_name: str, league: str) -> tuple:
     file_path = os.path.join(directory, file_name)
     return directory, file_path
 
+def get_game_cache_filepath(game_id: str) -> tuple:
+    """
+    Constructs the file path for a single game's cached play-by-play download.
+
+    Args:
+        game_id (str): The ID of the game.
+
+    Returns:
+        tuple: A tuple containing the directory and file path.
+    """
+    directory = GAME_CACHE_ROOT
+    file_path = os.path.join(directory, f"{game_id}.pickle")
+    return directory, file_path
+
+def get_game_ids_cache_filepath(season: str, team_id: str, league: str) -> tuple:
+    """
+    Constructs the file path for a team's cached list of game IDs in a season.
+
+    Args:
+        season (str): The season in the format 'YYYY-YY'.
+        team_id (str): The ID of the team.
+
+    Returns:
+        tuple: A tuple containing the directory and file path.
+    """
+    directory = os.path.join(GAME_CACHE_ROOT, league, season)
+    file_path = os.path.join(directory, f"game_ids_{team_id}.json")
+    return directory, file_path
+
 def save_pbp_to_csv(data: pd.DataFrame, season: str, team_name: str, league: str) -> None:
     """
     Saves the play-by-play data to a CSV file.
@@ -190,8 +257,9 @@ def save_pbp_to_csv(data: pd.DataFrame, season: str, team_name: str, league: str
     directory, file_path = get_completed_pbp_data_filepath(season, team_name, league)
     os.makedirs(directory, exist_ok=True)
 
-    # Save the DataFrame to a CSV file.
-    data.to_csv(file_path, index=False)
+    # Save the DataFrame to a CSV file (gzipped when COMPRESS_PBP_FILES is set) through a large write buffer.
+    with open(file_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        data.to_csv(f, index=False, compression=GZIP_OPTIONS if COMPRESS_PBP_FILES else None)
     print(f"Play-by-play data saved to {os.path.normpath(file_path)}", flush=True)
 
 def save_checkpoint(current_play_by_play_data: pd.DataFrame, season: str, team_name: str, league: str, failed_games: list = None, empty_games: list = None) -> None:
@@ -217,51 +285,74 @@ def save_checkpoint(current_play_by_play_data: pd.DataFrame, season: str, team_n
     with open(file_path, "wb") as f:
         pickle.dump(checkpoint_data, f)
 
-def fetch_game_pbp(game_id, max_attempts=MAX_ATTEMPTS, min_delay=MIN_DELAY, max_delay=MAX_DELAY) -> pd.DataFrame:
+def retry_delay(attempt: int) -> float:
+    """
+    Full-jitter exponential backoff: a random delay in [0, min(cap, base * 2^attempt)].
+    The randomness keeps concurrent workers from retrying in lockstep.
+    """
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+def fetch_game_pbp(game_id, max_attempts=MAX_ATTEMPTS) -> pd.DataFrame:
     """
     Fetches play-by-play data for a given game ID with retry logic.
     Args:
         game_id (str): The ID of the game to fetch play-by-play data for.
         max_attempts (int): Maximum number of attempts to fetch data.
-        initial_backoff (int): Initial backoff time in seconds for retries.
-        max_backoff (int): Maximum backoff time in seconds for retries.
-        timeout (int): Timeout for the request in seconds.
-        min_delay (int): Minimum delay between requests in seconds.
-        max_delay (int): Maximum delay between requests in seconds.
     Returns:
         pd.DataFrame: The play-by-play data for the game, or None if it could not be fetched.
     """
     from nba_api.stats.endpoints import playbyplayv2 as fresh_playbyplayv2
 
-    # backoff = initial_backoff
+    # Games downloaded by an earlier run (or for the other team in the matchup) come straight from disk.
+    cache_directory, cache_path = get_game_cache_filepath(game_id)
+    if os.path.exists(cache_path):
+        try:
+            cached = pd.read_pickle(cache_path)
+            if not cached.empty:
+                return cached
+        except Exception as e:
+            # Truncated files or pickles from another pandas version: warn and fetch the game again.
+            print(f"Warning: Ignoring unreadable cache file {os.path.normpath(cache_path)}: {e}", flush=True)
+
     for attempt in range(1, max_attempts + 1):
         try:
-            time.sleep(random.uniform(min_delay, max_delay)) # Random delay to avoid rate limiting.
-            return fresh_playbyplayv2.PlayByPlayV2(game_id=game_id, timeout=DEFAULT_TIMEOUT).get_data_frames()[0]
+            RATE_LIMITER.acquire() # Shared pacing across workers to avoid rate limiting.
+            play_by_play_data = fresh_playbyplayv2.PlayByPlayV2(game_id=game_id, timeout=DEFAULT_TIMEOUT).get_data_frames()[0]
+
+            # Only real data is cached: an empty response (throttling, or a game with no data yet) is retried next run.
+            # Write to a temporary file first so an interrupted run never leaves a truncated cache entry.
+            if not play_by_play_data.empty:
+                os.makedirs(cache_directory, exist_ok=True)
+                play_by_play_data.to_pickle(cache_path + ".tmp")
+                os.replace(cache_path + ".tmp", cache_path)
+            return play_by_play_data
         except (ConnectionError, ReadTimeout, requests.exceptions.ConnectionError):
             if attempt == max_attempts:
                 print(f"Max attempts reached for game ID {game_id}. Could not fetch data.", flush=True)
                 return None
             print(f"Attempt {attempt}: Timeout or connection error for game ID {game_id}.", flush=True)
+            time.sleep(retry_delay(attempt))
         except Exception as e:
             print(f"An unexpected error occurred for game ID {game_id}: {e}", flush=True)
             return None
 
-def load_existing_pbp_data(season: str, team_name: str, league: str) -> pd.DataFrame:
+def load_existing_pbp_data(season: str, team_name: str, league: str, file_path: str = None) -> pd.DataFrame:
     """
     Loads existing play-by-play data from a CSV file if it exists.
 
     Args:
         season (str): The season in the format 'YYYY-YY'.
         team_name (str): The nickname of the team.
+        file_path (str): Optional path already returned by find_completed_pbp_file, to skip looking it up again.
 
     Returns:
         pd.DataFrame: The play-by-play data if the file exists, otherwise an empty DataFrame.
     """
-    if completed_pbp_file_exists(season, team_name, league):
-        _, file_path = get_completed_pbp_data_filepath(season, team_name, league)
+    if file_path is None:
+        file_path = find_completed_pbp_file(season, team_name, league)
+    if file_path is not None:
         try:
-            return pd.read_csv(file_path)
+            return pd.read_csv(file_path, dtype=PBP_DTYPES)
         except pd.errors.EmptyDataError:
             print(f"Warning: The file {os.path.normpath(file_path)} is empty.", flush=True)
             return pd.DataFrame()
@@ -297,15 +388,39 @@ def load_checkpoint_data(season: str, team_name: str, league: str) -> tuple:
         print(f"No checkpoint data found for {team_name} in season {season}. Starting fresh.", flush=True)
         return pd.DataFrame(), [], []
     
-def fetch_team_game_ids(season: str, team_id: str, league: str, max_attempts: int = MAX_ATTEMPTS, min_delay: int = MIN_DELAY, max_delay: int = MAX_DELAY) -> pd.Series:
+@functools.lru_cache(maxsize=None)
+def find_team_id(team_name: str, league: str):
+    """
+    Looks up a team's ID by nickname through nba_api's static team index. Results are cached per process.
+    Args:
+        team_name (str): The nickname of the team. Ex: 'Celtics'.
+        league (str): 'nba' or 'wnba'.
+    Returns:
+        int: The team ID.
+    Raises:
+        ValueError: If the league is unsupported or no team has that nickname.
+    """
+    if league == "nba":
+        matches = teams.find_teams_by_nickname(team_name)
+    elif league == "wnba":
+        print("Available WNBA team nicknames:", [t['nickname'] for t in teams.get_wnba_teams()], flush=True)
+        matches = teams.find_wnba_teams_by_nickname(team_name)
+        if matches:
+            print('found wnba team id', matches[0]['id'], flush=True)
+    else:
+        raise ValueError(f"Unsupported league: {league}. Supported leagues are 'nba' and 'wnba'.")
+
+    if not matches:
+        raise ValueError(f"Team '{team_name}' not found. Please check the team name and try again.")
+    return matches[0]['id']
+
+def fetch_team_game_ids(season: str, team_id: str, league: str, max_attempts: int = MAX_ATTEMPTS) -> pd.Series:
     """
     Fetches all game IDs for a given team and season, with retry logic for timeouts.
     Args:
         season (str): The season in the format 'YYYY-YY'. Ex: '2006-07'.
         team_id (str): The ID of the team.
         max_attempts (int): Maximum number of attempts to fetch data.
-        min_delay (int): Minimum delay between retries in seconds.
-        max_delay (int): Maximum delay between retries in seconds.
     Returns:
         pd.Series: A pandas Series containing all game IDs for the team in the specified season.
     """
@@ -317,16 +432,32 @@ def fetch_team_game_ids(season: str, team_id: str, league: str, max_attempts: in
     if league == "wnba":
         season_id = season.split("-")[0]
 
+    # Re-runs (e.g. resuming a season) reuse the game list saved by the first successful lookup.
+    cache_directory, cache_path = get_game_ids_cache_filepath(season, team_id, league)
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as f:
+                return pd.Series(json.load(f), name="GAME_ID", dtype=object)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable game ID cache {os.path.normpath(cache_path)}: {e}", flush=True)
+
     for attempt in range(1, max_attempts + 1):
         try:
-            time.sleep(random.uniform(min_delay, max_delay))
+            RATE_LIMITER.acquire()
             gamefinder = fresh_leaguegamefinder.LeagueGameFinder(team_id_nullable=team_id, season_nullable=season_id)
-            return gamefinder.get_data_frames()[0].GAME_ID
+            game_ids = gamefinder.get_data_frames()[0].GAME_ID
+
+            os.makedirs(cache_directory, exist_ok=True)
+            with open(cache_path + ".tmp", "w") as f:
+                json.dump(game_ids.astype(str).tolist(), f)
+            os.replace(cache_path + ".tmp", cache_path)
+            return game_ids
         except (ConnectionError, ReadTimeout, requests.exceptions.ConnectionError):
             print(f"Attempt {attempt}: Timeout or connection error while fetching game IDs for team {team_id} in season {season}.", flush=True)
             if attempt == max_attempts:
                 print(f"Max attempts reached for team {team_id} in season {season}. Could not fetch game IDs.", flush=True)
                 return None
+            time.sleep(retry_delay(attempt))
         except Exception as e:
             print(f"An unexpected error occurred while fetching game IDs for team {team_id} in season {season}: {e}", flush=True)
             return None
@@ -341,7 +472,7 @@ def collect_games_pbp_data(game_ids: pd.Series, league: str, team_name: str = "U
     Returns:
         pd.DataFrame: A DataFrame containing the collected play-by-play data for all games.
     """
-    global CURRENT_PBP_DATA, CURRENT_SEASON, CURRENT_TEAM_NAME, CURRENT_LEAGUE, CURRENT_FAILED_GAMES, CURRENT_EMPTY_GAMES
+    global CURRENT_PBP_FRAMES, CURRENT_SEASON, CURRENT_TEAM_NAME, CURRENT_LEAGUE, CURRENT_FAILED_GAMES, CURRENT_EMPTY_GAMES
 
     # Set the state
     CURRENT_SEASON = season
@@ -355,7 +486,7 @@ def collect_games_pbp_data(game_ids: pd.Series, league: str, team_name: str = "U
     successful_games = []
     failed_games = []
     empty_games = []
-    all_play_by_play_data = pd.DataFrame()
+    frames = [] # Appended per game and concatenated once, instead of re-copying the accumulated rows every game.
 
     # If checkpoint data exists, we resume from there.
     if not checkpoint_data.empty:
@@ -366,7 +497,7 @@ def collect_games_pbp_data(game_ids: pd.Series, league: str, team_name: str = "U
 
         # Remove already processed games from the game_ids Series.
         game_ids = game_ids[~game_ids.isin(successful_games + empty_games)]  # Remove already processed games.
-        all_play_by_play_data = checkpoint_data
+        frames.append(checkpoint_data)
 
         print(f"Resuming from checkpoint. {len(successful_games)} game(s) already processed, {len(failed_games)} failed games, {len(empty_games)} empty games.", flush=True)
 
@@ -374,36 +505,47 @@ def collect_games_pbp_data(game_ids: pd.Series, league: str, team_name: str = "U
     total_games = len(game_ids) + len(successful_games) + len(empty_games)  # Total games to process including already processed ones.
 
     # Update state
-    CURRENT_PBP_DATA = all_play_by_play_data
+    CURRENT_PBP_FRAMES = frames
     CURRENT_FAILED_GAMES = failed_games
     CURRENT_EMPTY_GAMES = empty_games
 
-    # Loop through each game ID and fetch the play-by-play data.
-    for count, game_id in enumerate(game_ids, start=(len(successful_games) + len(empty_games) + 1)):
-        print(f"{count}/{total_games} Fetching play-by-play data for game ID {game_id}...", flush=True)
-        play_by_play_data = fetch_game_pbp(game_id)
-
-        if play_by_play_data is None:
-            failed_games.append(game_id)
-            CURRENT_FAILED_GAMES = failed_games
-            print(f"Failed to fetch data for game ID {game_id}. Retrying later.", flush=True)
-            save_checkpoint(all_play_by_play_data, season, team_name, league, failed_games)
-            return None
-        elif play_by_play_data.empty:
-            empty_games.append(game_id)
-            CURRENT_EMPTY_GAMES = empty_games
-            print(f"No data found for game ID {game_id}. This might be a preseason game.", flush=True)
-        else:
-            # Game processed successfully.
-            all_play_by_play_data = pd.concat([all_play_by_play_data, play_by_play_data], ignore_index=True)
-            successful_games.append(game_id)
-
-        # Periodic checkpoint 
-        if count % 10 == 0:
-            print(f"Checkpointing after processing {count} games...", flush=True)
-            save_checkpoint(all_play_by_play_data, season, team_name, league, failed_games, empty_games)
-
-        CURRENT_PBP_DATA = all_play_by_play_data
+    # Fetch games concurrently; each request is network-bound and requests are paced by the shared RATE_LIMITER.
+    # Results are handled here on the main thread, so the tracking lists and checkpoints stay consistent.
+    count = len(successful_games) + len(empty_games)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch_game_pbp, game_id): game_id for game_id in game_ids}
+        # Ctrl+C (signal_handler exits) must not let the pool drain the whole queue on the way out.
+        try:
+            for future in as_completed(futures):
+                game_id = futures[future]
+                play_by_play_data = future.result()
+                count += 1
+                print(f"{count}/{total_games} Fetched play-by-play data for game ID {game_id}.", flush=True)
+
+                if play_by_play_data is None:
+                    failed_games.append(game_id)
+                    CURRENT_FAILED_GAMES = failed_games
+                    print(f"Failed to fetch data for game ID {game_id}. Retrying later.", flush=True)
+                    # Drop the queued fetches; the ones already in flight finish and are discarded.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    save_checkpoint(combine_frames(frames), season, team_name, league, failed_games)
+                    return None
+                elif play_by_play_data.empty:
+                    empty_games.append(game_id)
+                    CURRENT_EMPTY_GAMES = empty_games
+                    print(f"No data found for game ID {game_id}. This might be a preseason game.", flush=True)
+                else:
+                    # Game processed successfully.
+                    frames.append(play_by_play_data)
+                    successful_games.append(game_id)
+
+                # Periodic checkpoint 
+                if count % 10 == 0:
+                    print(f"Checkpointing after processing {count} games...", flush=True)
+                    save_checkpoint(combine_frames(frames), season, team_name, league, failed_games, empty_games)
+        except (KeyboardInterrupt, SystemExit):
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     print(f"Completed {len(successful_games)} / {total_games} games for team '{team_name}' in season '{season}'.", flush=True)
 
@@ -421,6 +563,8 @@ def collect_games_pbp_data(game_ids: pd.Series, league: str, team_name: str = "U
         for game_id in empty_games:
             print(game_id, flush=True)
 
+    all_play_by_play_data = combine_frames(frames)
+
     # Save the current state to a checkpoint file.
     save_checkpoint(all_play_by_play_data, season, team_name, league, failed_games, empty_games)
     
@@ -438,25 +582,14 @@ def get_team_season_pbp(season: str, team_name: str, save_to_file: bool = False,
     Returns:
         pd.DataFrame: The play-by-play data for the team in the specified season.
     """
-    # Loads existing play-by-play data if it exists.
-    if completed_pbp_file_exists(season, team_name, league):
-        return load_existing_pbp_data(season, team_name, league)
+    # Loads existing play-by-play data if it exists (one lookup serves both the check and the read).
+    file_path = find_completed_pbp_file(season, team_name, league)
+    if file_path is not None:
+        return load_existing_pbp_data(season, team_name, league, file_path=file_path)
 
-    # Gets the team ID from the team name if not provided.
+    # Gets the team ID from the team name if not provided (raises ValueError for an unknown team).
     if team_id is None:
-        if league == "nba":
-            team_id = teams.find_teams_by_nickname(team_name)[0]['id']
-        elif league == "wnba":
-            print("Available WNBA team nicknames:", [t['nickname'] for t in teams.get_wnba_teams()], flush=True)
-            team_id = teams.find_wnba_teams_by_nickname(team_name)[0]['id']
-            print('found wnba team id', team_id, flush=True)
-        else:
-            raise ValueError(f"Unsupported league: {league}. Supported leagues are 'nba' and 'wnba'.")
-        
-        if not team_id:
-            print(f"Team '{team_name}' not found. Please check the team name and try again.", flush=True)
-            # raise ValueError(f"Team '{team_name}' not found. Please check the team name and try again.")
-            return None
+        team_id = find_team_id(team_name, league)
 
     # Gets all games for the given team and season as a pandas Series.
     games_ids = fetch_team_game_ids(season, team_id, league)
@@ -496,14 +629,12 @@ def get_all_teams_season_pbp(season: str, league: str = "nba"):
         teams_info = teams.get_wnba_teams()
         CURRENT_LEAGUE = "wnba"
 
-    teams_df = pd.DataFrame(teams_info)
-    teams_df = teams_df.sample(frac=1).reset_index(drop=True)  # Shuffle the teams.
+    teams_to_process = [(team['nickname'], team['id']) for team in teams_info]
+    random.shuffle(teams_to_process)  # Shuffle the teams.
 
     successful_processed_teams = []
     failed_processed_teams = []
-    all_team_keys = set((row['nickname'], row['id']) for _, row in teams_df.iterrows())
-    total_teams = len(all_team_keys)
-    teams_to_process = list(all_team_keys)
+    total_teams = len(teams_to_process)
 
     # Process teams until the list is empty
     consecutive_failures = 0
@@ -529,6 +660,9 @@ def get_all_teams_season_pbp(season: str, league: str = "nba"):
                 print(f"Could not access state file, retrying in 2s: {e}", flush=True)
                 time.sleep(2)  # Wait before retrying
 
+    # One directory scan up front instead of a stat per team
+    completed_teams = find_completed_teams(season, league)
+
     count = 1
     while teams_to_process:
         # Get the next team to process
@@ -537,41 +671,41 @@ def get_all_teams_season_pbp(season: str, league: str = "nba"):
         # Check if too many consecutive failures
         if consecutive_failures >= max_consecutive_failures:
             print(f"⚠️ Detected {consecutive_failures} consecutive API failures", flush=True)
-            print("API appears to be rate limiting. Saving state and restarting...", flush=True)
+            print("API appears to be rate limiting. Saving state and recycling connections...", flush=True)
             
-            # Save state before restarting
+            # Save state (including the current team) so a killed run can still resume from here
             with open(state_file, "wb") as f:
                 pickle.dump({
-                    "teams_to_process": teams_to_process,
+                    "teams_to_process": [(team_name, team_id)] + teams_to_process,
                     "successful": successful_processed_teams,
                     "failed": failed_processed_teams,
                     "count": count
                 }, f)
 
-            # Take a LONG break (similar to the time it takes to restart the script)
+            # Take a break before trying again
             cooldown_time = 10
             print(f"Taking a {cooldown_time}s cooldown break...", flush=True)
             time.sleep(cooldown_time)
             
-            # Perform a script restart
-            restart_script()
+            # Drop the (possibly throttled) pooled connections and carry on in this process
+            reset_connections()
+            consecutive_failures = 0
 
         # Reset the global state for the current team
-        CURRENT_PBP_DATA = pd.DataFrame()
+        CURRENT_PBP_FRAMES = []
         CURRENT_SEASON = season
         CURRENT_TEAM_NAME = team_name
         CURRENT_FAILED_GAMES = []
         CURRENT_EMPTY_GAMES = []
         
         # Check if the play-by-play data file already exists
-        if completed_pbp_file_exists(season, team_name, league):
+        if team_name in completed_teams:
             print(f"Skipping. Play-by-play data already exists in season {season} for {team_name}.", flush=True)
             count += 1
             successful_processed_teams.append(team_name)
             continue
         
-        # Fetch play-by-play data for the team
-        time.sleep(random.uniform(TEAM_DELAY_MIN, TEAM_DELAY_MAX))
+        # Fetch play-by-play data for the team (requests are paced by RATE_LIMITER, so no extra per-team delay)
         print(f"{count}/{total_teams} Processing play-by-play data for season {season}, for {team_name}...")
         team_season_pbp = get_team_season_pbp(season, team_name, save_to_file=True, team_id=team_id, league=league)
         
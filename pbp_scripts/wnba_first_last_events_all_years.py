@@ -8,17 +8,19 @@ output_folder = "/Users/abhinavapendyala/Downloads/wnba/"
 # Ensure output folder exists
 os.makedirs(output_folder, exist_ok=True)
 
-# Loop through each CSV in the raw data folder
+# Loop through each CSV (plain or gzipped) in the raw data folder
 for filename in os.listdir(input_folder):
-    if filename.endswith(".csv"):
+    if filename.endswith((".csv", ".csv.gz")):
+        stem = filename[:-len(".csv.gz")] if filename.endswith(".csv.gz") else filename[:-len(".csv")]
         filepath = os.path.join(input_folder, filename)
 
         try:
             df = pd.read_csv(filepath)
 
             # Get start and end rows
-            start_mask = df["NEUTRALDESCRIPTION"].fillna("").str.contains("Start of 1st Period", case=False, na=False)
-            end_mask = df["NEUTRALDESCRIPTION"].fillna("").str.contains("End of 4th Period", case=False, na=False)
+            nd_lower = df["NEUTRALDESCRIPTION"].fillna("").astype(str).str.lower()
+            start_mask = nd_lower.str.contains("start of 1st period", regex=False)
+            end_mask = nd_lower.str.contains("end of 4th period", regex=False)
 
             start_rows = df[start_mask].copy()
             end_rows = df[end_mask].copy()
@@ -30,10 +32,10 @@ for filename in os.listdir(input_folder):
             # Combine and add season + filename for traceability
             filtered = pd.concat([start_rows, end_rows])
             filtered["SEASON"] = df["SEASON"].iloc[0] if "SEASON" in df.columns else filename.split("_")[1]
-            filtered["SOURCE_FILE"] = filename
+            filtered["SOURCE_FILE"] = stem + ".csv"
 
             # Output file path
-            output_path = os.path.join(output_folder, filename.replace(".csv", "_duration_rows.csv"))
+            output_path = os.path.join(output_folder, stem + "_duration_rows.csv")
             filtered.to_csv(output_path, index=False)
 
             print(f"✅ Processed {filename} → {len(filtered)} rows saved to {output_path}")
@@ -48,13 +48,10 @@ def main():
         work["__SCORE_MAX"] = parsed.apply(lambda x: x[2])
     else: work["__SCORE_MAX"] = np.nan
     text_cols = [c for c in [home_desc, away_desc] if c]
-    def is_to(r):
-        if evt_type_col and not pd.isna(r.get(evt_type_col)):
-            try:
-                if int(r[evt_type_col]) == 9: return True
-            except: pass
-        return any("timeout" in str(r.get(tc,"")).lower() for tc in text_cols)
-    work["__IS_TIMEOUT"] = work.apply(is_to, axis=1)
+    is_to = pd.Series(False, index=work.index)
+    if evt_type_col: is_to |= pd.to_numeric(work[evt_type_col], errors="coerce").eq(9)
+    for tc in text_cols: is_to |= work[tc].astype(str).str.lower().str.contains("timeout", regex=False)
+    work["__IS_TIMEOUT"] = is_to
 
     work["__START_DT"], work["__END_DT"] = pd.NaT, pd.NaT
     if start_time_col: work["__START_DT"] = coerce_datetime(work[start_time_col])
@@ -72,19 +69,12 @@ def main():
         n_per = pd.to_numeric(g["__PER"], errors="coerce").dropna().astype(int).max() if g["__PER"].notna().any() else np.nan
         clock_reg = 0
         if g["__PER"].notna().any() and g["__CLOCK_S"].notna().any():
-            for _, gp in g.groupby("__PER"):
-                prev = None
-                for v in gp["__CLOCK_S"]:
-                    if np.isnan(v): continue
-                    if prev is not None and v > prev: clock_reg += 1
-                    prev = v
+            clock = g[["__PER", "__CLOCK_S"]].dropna()
+            clock_reg = int((clock.groupby("__PER")["__CLOCK_S"].diff() > 0).sum())
         score_drop = 0
         if g["__SCORE_MAX"].notna().any():
-            prev = -1
-            for v in g["__SCORE_MAX"]:
-                if np.isnan(v): continue
-                if v < prev: score_drop += 1
-                prev = max(prev, v)
+            score = g["__SCORE_MAX"].dropna().to_numpy()
+            score_drop = int(np.count_nonzero(score[1:] < np.maximum.accumulate(score)[:-1]))
         return pd.Series({
             "game_duration_minutes": dur,
             "periods_observed_max": n_per,
@@ -1,39 +1,50 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
 input_folder = "/Users/abhinavapendyala/Downloads/wnba/"
 output_file = "/Users/abhinavapendyala/Downloads/wnba/wnba_game_durations_all_years.csv"
 
-all_data = []
-
-# Process all *_duration_rows.csv files
-for filename in os.listdir(input_folder):
-    if filename.endswith("_duration_rows.csv"):
-        filepath = os.path.join(input_folder, filename)
-        df = pd.read_csv(filepath)
-
-        # Ensure required columns exist
-        if {"GAME_ID", "WCTIMESTRING", "EVENT_LABEL"}.issubset(df.columns):
-            games = df.groupby("GAME_ID")
-            for game_id, group in games:
-                start_row = group[group["EVENT_LABEL"] == "START"]
-                end_row = group[group["EVENT_LABEL"] == "END"]
-
-                if not start_row.empty and not end_row.empty:
-                    start_time = start_row.iloc[0]["WCTIMESTRING"]
-                    end_time = end_row.iloc[-1]["WCTIMESTRING"]
-                    season = start_row.iloc[0].get("SEASON", "")
-                    source = start_row.iloc[0].get("SOURCE_FILE", "")
-
-                    all_data.append({
-                        "GAME_ID": game_id,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "season": season,
-                        "source_file": source
-                    })
+OUT_COLS = ["GAME_ID", "start_time", "end_time", "season", "source_file"]
+REQUIRED = {"GAME_ID", "WCTIMESTRING", "EVENT_LABEL"}
+
+def read_rows(file_idx, filepath):
+    df = pd.read_csv(filepath)
+
+    # Ensure required columns exist
+    if not REQUIRED.issubset(df.columns):
+        return None
+    df = df[df["GAME_ID"].notna()]
+    out = pd.DataFrame({
+        "__FILE": file_idx,
+        "GAME_ID": df["GAME_ID"],
+        "WCTIMESTRING": df["WCTIMESTRING"],
+        "EVENT_LABEL": df["EVENT_LABEL"],
+        "season": df["SEASON"] if "SEASON" in df.columns else "",
+        "source_file": df["SOURCE_FILE"] if "SOURCE_FILE" in df.columns else "",
+    })
+    return out
+
+# Read all *_duration_rows.csv files concurrently, then pair once
+filepaths = [os.path.join(input_folder, f) for f in os.listdir(input_folder) if f.endswith("_duration_rows.csv")]
+with ThreadPoolExecutor(max_workers=min(8, len(filepaths) or 1)) as pool:
+    frames = [f for f in pool.map(read_rows, range(len(filepaths)), filepaths) if f is not None]
+
+if frames:
+    df = pd.concat(frames, ignore_index=True)
+    keys = ["__FILE", "GAME_ID"]
+    # First START and last END row per game (games are paired within their own file)
+    start_rows = df[df["EVENT_LABEL"] == "START"].drop_duplicates(keys, keep="first")
+    end_rows = df[df["EVENT_LABEL"] == "END"].drop_duplicates(keys, keep="last")
+
+    starts = start_rows[keys + ["WCTIMESTRING", "season", "source_file"]].rename(columns={"WCTIMESTRING": "start_time"})
+    ends = end_rows[keys + ["WCTIMESTRING"]].rename(columns={"WCTIMESTRING": "end_time"})
+
+    paired = starts.merge(ends, on=keys).sort_values(keys, kind="mergesort")
+    df_out = paired[OUT_COLS].reset_index(drop=True)
+else:
+    df_out = pd.DataFrame(columns=OUT_COLS)
 
 # Save to CSV
-df_out = pd.DataFrame(all_data)
 df_out.to_csv(output_file, index=False)
-print(f"✅ Saved paired game durations to {output_file}")
\ No newline at end of file
+print(f"✅ Saved paired game durations to {output_file}")